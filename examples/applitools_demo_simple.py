@@ -41,10 +41,10 @@ def demo_visual_testing_without_applitools():
     driver = webdriver.Chrome(service=service, options=chrome_options)
     driver.implicitly_wait(10)
 
-    try:
-        # Initialize visual tester
-        visual_tester = VisualTester()
+    # Initialize visual tester
+    visual_tester = VisualTester()
 
+    try:
         print("📊 Visual Tester Status:")
         print(f"   Applitools Available: {'✅ Yes' if visual_tester.eyes else '❌ No'}")
         print(
@@ -91,9 +91,7 @@ def demo_visual_testing_without_applitools():
             print("   ❌ Changes detected (as expected)")
             if "differences" in result:
                 diff_info = result["differences"]
-                print(
-                    f"   📈 Differences: {diff_info.get('total_differences', 0)} areas"
-                )
+                print(f"   📈 Differences: {diff_info.get('changed_pixels', 0)} pixels")
         else:
             print("   ✅ No changes detected")
 
@@ -159,6 +157,7 @@ def demo_visual_testing_without_applitools():
         print(f"❌ Demo error: {e}")
 
     finally:
+        visual_tester.close()
         driver.quit()
 
 
@@ -107,7 +107,7 @@ class ApplitoolsExample:
                     diff_info = result["differences"]
                     print(f"   📈 Difference statistics:")
                     print(
-                        f"      - Total differences: {diff_info.get('total_differences', 0)}"
+                        f"      - Changed pixels: {diff_info.get('changed_pixels', 0)}"
                     )
                     print(
                         f"      - Difference size: {diff_info.get('difference_percentage', 0):.2f}%"
@@ -419,6 +419,7 @@ class ApplitoolsExample:
 
     def cleanup(self):
         """Cleanup resources"""
+        self.visual_tester.close()
         if self.driver:
             self.driver.quit()
 
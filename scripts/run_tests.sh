@@ -202,7 +202,7 @@ build_pytest_command() {
 
     # Add parallel execution
     if [ "$PARALLEL" = true ]; then
-        cmd="$cmd -n auto"
+        cmd="$cmd -n auto --dist=loadscope"
     fi
 
     # Add retries
@@ -38,10 +38,9 @@ class BrowserManager:
             if self.browser_type == BROWSER_CHROME:
                 options = webdriver.ChromeOptions()
                 if self.headless:
-                    options.add_argument("--headless")
+                    options.add_argument("--headless=new")
                 options.add_argument("--no-sandbox")
                 options.add_argument("--disable-dev-shm-usage")
-                options.add_argument("--disable-gpu")
                 options.add_argument("--window-size=1920,1080")
 
                 service = ChromeService(ChromeDriverManager().install())
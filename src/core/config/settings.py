@@ -19,6 +19,7 @@ class Settings(BaseSettings):
     headless: bool = Field(default=True, env="HEADLESS")
     browser_timeout: int = Field(default=30, env="BROWSER_TIMEOUT")
     implicit_wait: int = Field(default=10, env="IMPLICIT_WAIT")
+    block_assets: bool = Field(default=False, env="SMARTSHOP_BLOCK_ASSETS")
 
     # API Configuration
     api_timeout: int = Field(default=30, env="API_TIMEOUT")
@@ -56,6 +57,8 @@ class Settings(BaseSettings):
     )
     html_report_dir: str = Field(default="./reports/html", env="HTML_REPORT_DIR")
     screenshot_dir: str = Field(default="./reports/screenshots", env="SCREENSHOT_DIR")
+    persist_screenshots: bool = Field(default=False, env="PERSIST_SCREENSHOTS")
+    fast_png_decode: bool = Field(default=False, env="FAST_PNG_DECODE")
 
     # Performance Testing
     locust_host: str = Field(default="https://demo.smartshop.com", env="LOCUST_HOST")
@@ -0,0 +1,27 @@
+"""
+Constants used only by AI data generation
+"""
+
+from types import MappingProxyType
+
+# AI prompts
+AI_PROMPTS = MappingProxyType(
+    {
+        "user_profile": "Generate a realistic user profile for a {} user with the following fields: first_name, last_name, email, phone, address, city, country, postal_code, date_of_birth, preferences (list), loyalty_points (integer), registration_date. Return as JSON.",
+        "product_catalog": "Generate {} realistic products for the {} category with the following fields: name, description, price (float), currency, category, brand, sku, stock_quantity (integer), rating (float), features (list), images (list of URLs). Return as JSON array.",
+        "search_terms": "Generate {} realistic search terms that a user might use to find products in an e-commerce store. Return as JSON array of strings.",
+        "test_scenarios": "Generate realistic test scenarios for {} functionality with the following fields: title, description, steps (list), expected_result, priority (high/medium/low), tags (list). Return as JSON array.",
+    }
+)
+
+# OpenAI error codes
+OPENAI_ERROR_CODES = MappingProxyType(
+    {
+        "geographic_restriction": "unsupported_country_region_territory",
+        "invalid_api_key": "invalid_api_key",
+        "rate_limit": "rate_limit_exceeded",
+        "quota_exceeded": "quota_exceeded",
+        "model_not_found": "model_not_found",
+        "invalid_request": "invalid_request",
+    }
+)
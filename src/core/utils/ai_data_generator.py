@@ -17,8 +17,13 @@ from src.core.config.settings import settings
 class AIDataGenerator:
     """Test data generator using AI"""
 
+    # Faker loads its locale providers on construction, so one is shared
+    _shared_fake = None
+
     def __init__(self):
-        self.fake = Faker(["en_US"])
+        if AIDataGenerator._shared_fake is None:
+            AIDataGenerator._shared_fake = Faker(["en_US"])
+        self.fake = AIDataGenerator._shared_fake
         self.openai_client = None
 
         if settings.openai_api_key:
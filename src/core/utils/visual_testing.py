@@ -3,35 +3,82 @@ AI-powered visual testing
 Integration with Applitools and custom computer vision algorithms
 """
 
+import base64
+import hashlib
+import json
 import os
+import sqlite3
+import tempfile
 import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Any
 
 import cv2
 import numpy as np
+import xxhash
 from loguru import logger
-from PIL import Image
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from src.core.config.settings import settings
+from src.core.constants import REPORT_DIR
 
 try:
-    from applitools.selenium import Eyes, Target
+    from applitools.selenium import ClassicRunner, Eyes, Target
 
     APPLITOOLS_AVAILABLE = True
 except ImportError:
     APPLITOOLS_AVAILABLE = False
     logger.warning("Applitools not installed")
 
+try:
+    import pyvips
+
+    PYVIPS_AVAILABLE = True
+except (ImportError, OSError):
+    PYVIPS_AVAILABLE = False
+
+# Local cache of perceptual hashes and statuses from earlier visual checks
+VISUAL_CACHE_PATH = os.path.join(REPORT_DIR, "visual_cache.db")
+
+# Side in pixels of the square blocks compared by find_changed_regions
+SHINGLE_SIZE = 40
+
+# Scale of the grid changed pixels are counted on; a cell counts as changed
+# when any of its pixels changed
+COMPARE_SCALE = 0.5
+
+# Fast PNG compression for report images, which are written off the test thread
+PNG_WRITE_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1]
+
+# Seconds a result cached for an identical screenshot, or an Applitools pass
+# cached for a page hash, stays valid
+RESULT_CACHE_TTL = 24 * 60 * 60
+
+# Largest dHash Hamming distance still treated as an unchanged screenshot
+DHASH_MAX_DISTANCE = 0
+
+# Grayscale difference above which a pixel counts as changed
+DIFF_THRESHOLD = 30
+
+# Final outcomes worth caching; a warning such as a new baseline is not final
+CACHEABLE_STATUSES = frozenset({"passed", "failed"})
+
 
 class VisualTester:
     """Class for AI-powered visual testing"""
 
     def __init__(self):
         self.eyes = None
+        self.runner = None
+        self._in_batch = False
+        self._applitools_test: str | None = None
+        # Page hashes per Applitools test, cached once the runner confirms a pass
+        self._pending_passes: dict[str, list[tuple[str, int]]] = {}
         self.screenshot_dir = settings.screenshot_dir
         self.baseline_dir = os.path.join(self.screenshot_dir, "baseline")
         self.current_dir = os.path.join(self.screenshot_dir, "current")
@@ -46,6 +93,14 @@ class VisualTester:
         ]:
             os.makedirs(directory, exist_ok=True)
 
+        self.cache_db = self._open_cache()
+        self._baseline_cache: dict[str, tuple[float, np.ndarray, bytes]] = {}
+        self.compare_scale = COMPARE_SCALE
+        self._scratch: dict[tuple[int, ...], tuple[np.ndarray, ...]] = {}
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._compare_pool = ThreadPoolExecutor(max_workers=1)
+        self._pending_writes: list[Future] = []
+
         # Initialize Applitools if available
         if APPLITOOLS_AVAILABLE and settings.applitools_api_key:
             self._init_applitools()
@@ -53,19 +108,139 @@ class VisualTester:
     def _init_applitools(self):
         """Initialize Applitools"""
         try:
-            self.eyes = Eyes()
+            # The runner collects results of sessions closed in the background
+            self.runner = ClassicRunner()
+            self.eyes = Eyes(self.runner)
             self.eyes.api_key = settings.applitools_api_key
             self.eyes.app_name = settings.applitools_app_name
             logger.info("Applitools Eyes initialized")
         except Exception as e:
             logger.error(f"Error initializing Applitools: {e}")
             self.eyes = None
+            self.runner = None
+
+    def close(self) -> list[str]:
+        """
+        Wait for background Applitools closes and writes, then close the cache
+
+        Returns:
+            Names of Applitools tests that did not pass, each also logged
+        """
+        not_passed = []
+        if self.runner:
+            try:
+                summary = self.runner.get_all_test_results(False)
+                not_passed = self._collect_applitools_results(summary)
+            except Exception as e:
+                logger.error(f"Error waiting for Applitools results: {e}")
+        self.flush()
+        self._io_pool.shutdown()
+        self._compare_pool.shutdown()
+        self.cache_db.close()
+        return not_passed
+
+    def _collect_applitools_results(self, summary) -> list[str]:
+        """
+        Log every Applitools test in the runner summary that did not pass
+
+        Page hashes checked in tests that all passed are cached, so later
+        unchanged screenshots of those pages skip the upload.
+        """
+        passed, not_passed = set(), []
+        for container in summary:
+            results = container.test_results
+            if container.exception or results is None:
+                logger.error(f"Applitools test did not complete: {container.exception}")
+                not_passed.append(str(results.name if results else "unknown"))
+            elif not results.is_passed:
+                logger.error(
+                    f"Applitools test {results.name} is {results.status}: {results.url}"
+                )
+                not_passed.append(results.name)
+            else:
+                passed.add(results.name)
+
+        for test_name in passed.difference(not_passed):
+            for page_name, dhash in self._pending_passes.get(test_name, []):
+                self._cache_applitools_pass(page_name, dhash)
+        self._pending_passes.clear()
+        return not_passed
+
+    def flush(self):
+        """Wait until all screenshots and diff images are written"""
+        for future in self._pending_writes:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error writing image: {e}")
+        self._pending_writes.clear()
+
+    def _write_image(self, path: str, image: np.ndarray):
+        """Write a report image in the background"""
+        self._pending_writes.append(
+            self._io_pool.submit(cv2.imwrite, path, image, PNG_WRITE_PARAMS)
+        )
+
+    @contextmanager
+    def batch(
+        self, test_name: str, driver: WebDriver, send_dom: bool = False
+    ) -> Iterator["VisualTester"]:
+        """
+        Run every check in the block as a checkpoint of one Applitools test
+
+        Opening and closing Eyes once for the block saves a session round-trip
+        per check. Local screenshot comparison is unaffected.
+
+        Args:
+            test_name: Applitools test name
+            driver: WebDriver
+            send_dom: Upload the DOM snapshot for Applitools root-cause analysis
+        """
+        session_open = False
+        if self.eyes:
+            try:
+                self.eyes.configure.set_send_dom(send_dom)
+                self.eyes.open(driver, "SmartShop", test_name)
+                session_open = True
+            except Exception as e:
+                logger.error(f"Error opening Applitools batch: {e}")
+
+        self._in_batch = session_open
+        self._applitools_test = test_name if session_open else None
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            self._applitools_test = None
+            if session_open:
+                try:
+                    self.eyes.close_async()
+                except Exception as e:
+                    logger.error(f"Error closing Applitools batch: {e}")
+
+    def _open_cache(self) -> sqlite3.Connection:
+        """Open the local visual check cache"""
+        os.makedirs(os.path.dirname(VISUAL_CACHE_PATH), exist_ok=True)
+        connection = sqlite3.connect(VISUAL_CACHE_PATH)
+        # WAL lets parallel workers read while one of them writes
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS applitools_passes "
+            "(page_name TEXT PRIMARY KEY, dhash TEXT, ts INTEGER)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS check_results "
+            "(key BLOB PRIMARY KEY, result TEXT, ts INTEGER)"
+        )
+        return connection
 
     def check_page_layout(
         self,
         page_name: str,
         driver: WebDriver,
         region: tuple[int, int, int, int] | None = None,
+        send_dom: bool = False,
     ) -> dict[str, Any]:
         """
         Check page layout using AI
@@ -74,6 +249,7 @@ class VisualTester:
             page_name: Page name
             driver: WebDriver
             region: Region to check (x, y, width, height)
+            send_dom: Upload the DOM snapshot for Applitools root-cause analysis
 
         Returns:
             Dict with check results
@@ -81,66 +257,225 @@ class VisualTester:
         logger.info(f"Starting visual check for page: {page_name}")
 
         # Take screenshot
-        screenshot_path = self._take_screenshot(driver, page_name, region)
+        screenshot = self._take_screenshot(driver, region)
+
+        # Skip both checks for a screenshot seen recently with identical pixels
+        # and compared against the same local baseline
+        screenshot_key = self._screenshot_key(page_name, screenshot)
+        cached_result = self._get_cached_result(screenshot_key)
+        if cached_result:
+            logger.info(
+                f"Visual check unchanged since last run: {cached_result['status']}"
+            )
+            return {**cached_result, "cached": True, "timestamp": time.time()}
 
-        # Check with Applitools if available
-        if self.eyes:
-            applitools_result = self._check_with_applitools(page_name, driver, region)
+        # A page that looks as it did when Applitools last passed it skips the
+        # upload. dHash misses small changes, so the local comparison still runs
+        dhash = self._dhash(screenshot)
+        eyes_unchanged = self._applitools_passed(page_name, dhash)
+
+        # Check with Applitools if available, comparing locally while it waits
+        # on the network. The custom check only reads the decoded screenshot,
+        # so the driver stays on this thread
+        if self.eyes and eyes_unchanged:
+            applitools_result = {
+                "status": "passed",
+                "cached": True,
+                "reason": "Page unchanged since Applitools last passed it",
+            }
+            custom_result = self._check_with_custom_algorithm(page_name, screenshot)
+        elif self.eyes:
+            custom_future = self._compare_pool.submit(
+                self._check_with_custom_algorithm, page_name, screenshot
+            )
+            applitools_result = self._check_with_applitools(
+                page_name, driver, region, send_dom
+            )
+            custom_result = custom_future.result()
         else:
             applitools_result = {
                 "status": "skipped",
                 "reason": "Applitools not available",
             }
+            custom_result = self._check_with_custom_algorithm(page_name, screenshot)
 
-        # Check with custom algorithm
-        custom_result = self._check_with_custom_algorithm(page_name, screenshot_path)
+        # Keep the screenshot on disk when it is needed to investigate
+        if settings.persist_screenshots or custom_result.get("status") == "failed":
+            self._save_screenshot(page_name, screenshot)
 
         # Analyze results
         overall_result = self._analyze_results(applitools_result, custom_result)
 
+        # Only cache outcomes that a rerun on the same image would repeat. Within
+        # the TTL identical bytes repeat even a failure, e.g. on a flaky retry
+        if overall_result["status"] in CACHEABLE_STATUSES and "error" not in (
+            applitools_result.get("status"),
+            custom_result.get("status"),
+        ):
+            self._cache_result(screenshot_key, overall_result)
+        if applitools_result.get("status") == "passed" and not eyes_unchanged:
+            # Trusted only once the runner confirms the whole Applitools test
+            test_name = self._applitools_test or page_name
+            self._pending_passes.setdefault(test_name, []).append((page_name, dhash))
+
         logger.info(f"Visual check completed: {overall_result['status']}")
         return overall_result
 
     def _take_screenshot(
         self,
         driver: WebDriver,
-        page_name: str,
         region: tuple[int, int, int, int] | None = None,
-    ) -> str:
-        """Take page screenshot"""
-        timestamp = int(time.time())
-        filename = f"{page_name}_{timestamp}.png"
+    ) -> np.ndarray:
+        """Take page screenshot and decode it in memory"""
+        # Chromium renders just the region in one call; others crop afterwards
+        if hasattr(driver, "execute_cdp_cmd"):
+            png = self._capture_with_cdp(driver, region)
+        else:
+            png = driver.get_screenshot_as_png()
+
+        screenshot = self._decode_png(png)
+        if screenshot is None:
+            raise ValueError("Failed to decode screenshot")
+
+        if region and not hasattr(driver, "execute_cdp_cmd"):
+            x, y, width, height = region
+            screenshot = screenshot[y : y + height, x : x + width]
+
+        return screenshot
+
+    def _decode_png(self, png: bytes) -> np.ndarray | None:
+        """Decode PNG bytes to a BGR image, with libvips when enabled"""
+        if not (PYVIPS_AVAILABLE and settings.fast_png_decode):
+            return cv2.imdecode(np.frombuffer(png, np.uint8), cv2.IMREAD_COLOR)
+
+        try:
+            image = pyvips.Image.new_from_buffer(png, "")
+        except pyvips.Error:
+            return None
+        if image.bands < 3:
+            image = image.colourspace("srgb")
+        pixels = np.ndarray(
+            buffer=image.write_to_memory(),
+            dtype=np.uint8,
+            shape=(image.height, image.width, image.bands),
+        )
+        # libvips yields RGB(A); the rest of the pipeline works in OpenCV's BGR
+        return np.ascontiguousarray(pixels[..., 2::-1])
+
+    def _save_screenshot(self, page_name: str, screenshot: np.ndarray):
+        """Save screenshot to the current screenshots directory"""
+        filename = f"{page_name}_{self._image_id(screenshot)}.png"
         screenshot_path = os.path.join(self.current_dir, filename)
+        self._write_image(screenshot_path, screenshot)
+        logger.info(f"Screenshot saved: {screenshot_path}")
 
-        # Take screenshot
-        driver.save_screenshot(screenshot_path)
+    def _image_id(self, image: np.ndarray) -> str:
+        """Content-based id used in file names, so identical images share a file"""
+        return xxhash.xxh3_64_hexdigest(image.tobytes())
 
-        # Crop region if specified
+    def _capture_with_cdp(
+        self,
+        driver: WebDriver,
+        region: tuple[int, int, int, int] | None = None,
+    ) -> bytes:
+        """Capture the viewport, or only the region, with Page.captureScreenshot"""
+        params = {"format": "png"}
         if region:
-            self._crop_screenshot(screenshot_path, region)
+            x, y, width, height = region
+            params["clip"] = {
+                "x": x,
+                "y": y,
+                "width": width,
+                "height": height,
+                "scale": 1,
+            }
+            params["captureBeyondViewport"] = True
+
+        screenshot = driver.execute_cdp_cmd("Page.captureScreenshot", params)
+        return base64.b64decode(screenshot["data"])
+
+    def _dhash(self, screenshot: np.ndarray) -> int:
+        """Compute the 64-bit difference hash of a screenshot"""
+        gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
+        small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+        bits = (small[:, 1:] > small[:, :-1]).flatten()
+        return sum(1 << i for i, bit in enumerate(bits) if bit)
+
+    def _screenshot_key(self, page_name: str, screenshot: np.ndarray) -> bytes:
+        """Build the cache key of a screenshot from its pixels, page and baseline"""
+        # A replaced or deleted baseline changes the key, so it is compared again
+        baseline_path = os.path.join(self.baseline_dir, f"{page_name}.png")
+        baseline_digest = b""
+        if os.path.exists(baseline_path):
+            baseline_digest = self._load_baseline(baseline_path)[1] or b""
+
+        content_hash = xxhash.xxh3_128(screenshot.tobytes()).digest()
+        name_hash = hashlib.blake2b(
+            page_name.encode() + baseline_digest, digest_size=16
+        ).digest()
+        return content_hash + name_hash
+
+    def _get_cached_result(self, key: bytes | None) -> dict[str, Any] | None:
+        """Return the result cached for an identical screenshot within the TTL"""
+        if key is None:
+            return None
+
+        row = self.cache_db.execute(
+            "SELECT result FROM check_results WHERE key = ? AND ts > ?",
+            (key, int(time.time()) - RESULT_CACHE_TTL),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _cache_result(self, key: bytes | None, result: dict[str, Any]):
+        """Remember the full result of an exact screenshot"""
+        if key is None:
+            return
+
+        # SDK objects such as the Applitools MatchResult are kept as text
+        with self.cache_db:
+            self.cache_db.execute(
+                "INSERT OR REPLACE INTO check_results VALUES (?, ?, ?)",
+                (key, json.dumps(result, default=str), int(time.time())),
+            )
 
-        logger.info(f"Screenshot saved: {screenshot_path}")
-        return screenshot_path
+    def _applitools_passed(self, page_name: str, dhash: int | None) -> bool:
+        """Whether Applitools recently passed a screenshot with a matching hash"""
+        if dhash is None:
+            return False
 
-    def _crop_screenshot(self, screenshot_path: str, region: tuple[int, int, int, int]):
-        """Crop screenshot by specified region"""
-        try:
-            image = Image.open(screenshot_path)
-            cropped = image.crop(region)
-            cropped.save(screenshot_path)
-            logger.info(f"Screenshot cropped by region: {region}")
-        except Exception as e:
-            logger.error(f"Error cropping screenshot: {e}")
+        row = self.cache_db.execute(
+            "SELECT dhash FROM applitools_passes WHERE page_name = ? AND ts > ?",
+            (page_name, int(time.time()) - RESULT_CACHE_TTL),
+        ).fetchone()
+        return bool(
+            row and bin(int(row[0], 16) ^ dhash).count("1") <= DHASH_MAX_DISTANCE
+        )
+
+    def _cache_applitools_pass(self, page_name: str, dhash: int | None):
+        """Remember a screenshot hash whose Applitools test passed"""
+        if dhash is None:
+            return
+
+        # Stored as hex because SQLite integers are signed 64-bit
+        with self.cache_db:
+            self.cache_db.execute(
+                "INSERT OR REPLACE INTO applitools_passes VALUES (?, ?, ?)",
+                (page_name, f"{dhash:016x}", int(time.time())),
+            )
 
     def _check_with_applitools(
         self,
         page_name: str,
         driver: WebDriver,
         region: tuple[int, int, int, int] | None,
+        send_dom: bool = False,
     ) -> dict[str, Any]:
         """Check with Applitools"""
         try:
-            self.eyes.open(driver, "SmartShop", page_name)
+            # Inside batch() the session is already open
+            if not self._in_batch:
+                self.eyes.configure.set_send_dom(send_dom)
+                self.eyes.open(driver, "SmartShop", page_name)
 
             if region:
                 target = Target.region(region)
@@ -148,12 +483,14 @@ class VisualTester:
                 target = Target.window()
 
             result = self.eyes.check(page_name, target)
-            self.eyes.close()
+            if not self._in_batch:
+                self.eyes.close_async()
 
+            # MatchResult is always truthy; as_expected says whether it matched
+            matched = bool(result and result.as_expected)
             return {
-                "status": "passed" if result else "failed",
+                "status": "passed" if matched else "failed",
                 "applitools_result": result,
-                "differences": result.differences if result else [],
             }
 
         except Exception as e:
@@ -161,7 +498,7 @@ class VisualTester:
             return {"status": "error", "error": str(e)}
 
     def _check_with_custom_algorithm(
-        self, page_name: str, screenshot_path: str
+        self, page_name: str, screenshot: np.ndarray
     ) -> dict[str, Any]:
         """Check with custom computer vision algorithm"""
         try:
@@ -169,20 +506,21 @@ class VisualTester:
 
             # If no baseline, create it
             if not os.path.exists(baseline_path):
-                self._create_baseline(screenshot_path, baseline_path)
+                self._create_baseline(screenshot, baseline_path)
                 return {"status": "baseline_created", "message": "New baseline created"}
 
             # Compare with baseline
-            differences = self._compare_images(baseline_path, screenshot_path)
+            differences = self._compare_images(baseline_path, screenshot)
+            diff = differences.pop("diff", None)
 
-            if differences["total_differences"] == 0:
+            if differences["changed_pixels"] == 0:
                 return {"status": "passed", "differences": differences}
             else:
                 # Save diff image
                 diff_path = os.path.join(
-                    self.diff_dir, f"{page_name}_diff_{int(time.time())}.png"
+                    self.diff_dir, f"{page_name}_diff_{self._image_id(screenshot)}.png"
                 )
-                self._save_diff_image(baseline_path, screenshot_path, diff_path)
+                self._save_diff_image(diff, diff_path)
 
                 return {
                     "status": "failed",
@@ -194,77 +532,305 @@ class VisualTester:
             logger.error(f"Error in custom check: {e}")
             return {"status": "error", "error": str(e)}
 
-    def _create_baseline(self, current_path: str, baseline_path: str):
+    def _create_baseline(self, screenshot: np.ndarray, baseline_path: str):
         """Create baseline from current screenshot"""
         try:
-            import shutil
-
-            shutil.copy2(current_path, baseline_path)
+            cv2.imwrite(baseline_path, screenshot)
+            self._save_baseline_array(baseline_path, screenshot)
             logger.info(f"Baseline created: {baseline_path}")
         except Exception as e:
             logger.error(f"Error creating baseline: {e}")
 
-    def _compare_images(self, baseline_path: str, current_path: str) -> dict[str, Any]:
-        """Compare two images and return differences"""
+    def _baseline_array_path(self, baseline_path: str) -> str:
+        """Path of the decoded copy kept next to a baseline PNG"""
+        return os.path.splitext(baseline_path)[0] + ".npy"
+
+    def _save_baseline_array(self, baseline_path: str, baseline: np.ndarray):
+        """
+        Write the decoded copy of a baseline next to it
+
+        Other workers may map the file at any time, so it is written under a
+        temporary name and moved into place in one step.
+        """
+        array_path = self._baseline_array_path(baseline_path)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(array_path),
+            prefix=os.path.basename(array_path),
+            suffix=".tmp",
+        )
         try:
-            # Load images
-            baseline = cv2.imread(baseline_path)
-            current = cv2.imread(current_path)
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, baseline)
+            os.replace(tmp_path, array_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _load_baseline(
+        self, baseline_path: str
+    ) -> tuple[np.ndarray | None, bytes | None]:
+        """
+        Load a baseline image, reusing the decoded copy until the file changes
+
+        Returns:
+            Baseline image and the xxh3 digest of its pixels
+        """
+        mtime = os.path.getmtime(baseline_path)
+        cached = self._baseline_cache.get(baseline_path)
+        if cached and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        # The PNG stays the reviewable source; a replaced PNG makes the array stale
+        array_path = self._baseline_array_path(baseline_path)
+        if os.path.exists(array_path) and os.path.getmtime(array_path) >= mtime:
+            baseline = np.load(array_path, mmap_mode="r")
+        else:
+            with open(baseline_path, "rb") as f:
+                baseline = self._decode_png(f.read())
+            if baseline is not None:
+                self._save_baseline_array(baseline_path, baseline)
+
+        if baseline is None:
+            return None, None
+
+        digest = xxhash.xxh3_128(baseline.tobytes()).digest()
+        self._baseline_cache[baseline_path] = (mtime, baseline, digest)
+        return baseline, digest
+
+    def _pool_changes(self, mask: np.ndarray) -> np.ndarray:
+        """
+        Shrink changed-pixel masks by compare_scale, keeping any changed pixel
+
+        Pooling by maximum after diffing keeps a one-pixel change that shrinking
+        the images first would average away. Leading axes are kept, so a stack
+        of masks pools in one call.
+        """
+        factor = round(1 / self.compare_scale)
+        if factor <= 1:
+            return mask
+
+        *lead, height, width = mask.shape
+        rows, cols = -(-height // factor), -(-width // factor)
+        padding = [(0, 0)] * len(lead)
+        padding += [(0, rows * factor - height), (0, cols * factor - width)]
+        pooled = np.pad(mask, padding).reshape(*lead, rows, factor, cols, factor)
+        return pooled.max(axis=(-3, -1))
+
+    def _compare_images(
+        self, baseline_path: str, current: np.ndarray
+    ) -> dict[str, Any]:
+        """Compare the current screenshot with its baseline and return differences"""
+        try:
+            # Load baseline
+            baseline, baseline_digest = self._load_baseline(baseline_path)
 
             if baseline is None or current is None:
                 return {"status": "error", "error": "Failed to load images"}
 
-            # Resize to same size
-            if baseline.shape != current.shape:
-                current = cv2.resize(current, (baseline.shape[1], baseline.shape[0]))
+            # Identical pixels need no diff
+            if (
+                baseline.shape == current.shape
+                and xxhash.xxh3_128(current.tobytes()).digest() == baseline_digest
+            ):
+                return {"changed_pixels": 0, "difference_percentage": 0.0}
 
-            # Calculate difference
-            diff = cv2.absdiff(baseline, current)
+            # Resize to same size, averaging when shrinking
+            if baseline.shape != current.shape:
+                shrinking = current.shape[0] * current.shape[1] > (
+                    baseline.shape[0] * baseline.shape[1]
+                )
+                current = cv2.resize(
+                    current,
+                    (baseline.shape[1], baseline.shape[0]),
+                    interpolation=cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR,
+                )
 
-            # Convert to grayscale for analysis
-            gray_diff = cv2.cvtColor(diff, cv2.COLOR_BGR2GRAY)
-
-            # Find differences
-            _, thresh = cv2.threshold(gray_diff, 30, 255, cv2.THRESH_BINARY)
-            contours, _ = cv2.findContours(
-                thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-            )
+            # Count cells of the compare grid holding a noticeably changed pixel
+            diff, thresh = self._diff_mask(baseline, current)
+            changes = self._pool_changes(thresh)
+            changed_pixels = cv2.countNonZero(changes)
 
             # Calculate statistics
-            total_differences = len(contours)
-            total_pixels = baseline.shape[0] * baseline.shape[1]
+            total_pixels = changes.size
             difference_percentage = (
-                (total_differences / total_pixels) * 100 if total_pixels > 0 else 0
+                (changed_pixels / total_pixels) * 100 if total_pixels > 0 else 0
             )
 
             return {
-                "total_differences": total_differences,
+                "changed_pixels": changed_pixels,
                 "difference_percentage": difference_percentage,
-                "contours": contours,
+                "diff": diff.copy() if changed_pixels else None,
             }
 
         except Exception as e:
             logger.error(f"Error comparing images: {e}")
             return {"status": "error", "error": str(e)}
 
-    def _save_diff_image(self, baseline_path: str, current_path: str, diff_path: str):
-        """Save difference image"""
-        try:
-            baseline = cv2.imread(baseline_path)
-            current = cv2.imread(current_path)
+    def _diff_mask(
+        self, baseline: np.ndarray, current: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Difference and changed-pixel mask of two same-sized images
 
-            if baseline is None or current is None:
-                return
+        Both are written into buffers reused for every comparison of this size,
+        so a diff kept past the next comparison must be copied, e.g. for the
+        report image written in the background.
+        """
+        diff, gray_diff, thresh = self._scratch_buffers(baseline.shape)
+        cv2.absdiff(baseline, current, dst=diff)
+        cv2.cvtColor(diff, cv2.COLOR_BGR2GRAY, dst=gray_diff)
+        cv2.threshold(gray_diff, DIFF_THRESHOLD, 255, cv2.THRESH_BINARY, dst=thresh)
+        return diff, thresh
+
+    def _scratch_buffers(self, shape: tuple[int, ...]) -> tuple[np.ndarray, ...]:
+        """Diff, grayscale and threshold buffers for images of the given shape"""
+        buffers = self._scratch.get(shape)
+        if buffers is None:
+            diff = np.empty(shape, np.uint8)
+            gray = np.empty(shape[:2], np.uint8)
+            buffers = (diff, gray, np.empty_like(gray))
+            self._scratch[shape] = buffers
+        return buffers
+
+    def find_changed_regions(
+        self, before_png: bytes, after_png: bytes, block_size: int = SHINGLE_SIZE
+    ) -> list[tuple[int, int, int, int]]:
+        """
+        Find the regions that differ between two screenshots
 
-            # Resize to same size
-            if baseline.shape != current.shape:
-                current = cv2.resize(current, (baseline.shape[1], baseline.shape[0]))
+        Both images are split into square blocks, and touching changed blocks
+        are merged into one region, so only those need a visual check.
+
+        Args:
+            before_png: Screenshot before the change
+            after_png: Screenshot after the change
+            block_size: Block side in pixels
 
-            # Calculate difference
-            diff = cv2.absdiff(baseline, current)
+        Returns:
+            List of changed regions (x, y, width, height)
+        """
+        before = cv2.imdecode(np.frombuffer(before_png, np.uint8), cv2.IMREAD_COLOR)
+        after = cv2.imdecode(np.frombuffer(after_png, np.uint8), cv2.IMREAD_COLOR)
+        if after is None:
+            return []
+
+        height, width = after.shape[:2]
+        if before is None or before.shape != after.shape:
+            return [(0, 0, width, height)]
+
+        # Pad to whole blocks, then flag every block with any changed pixel
+        rows, cols = -(-height // block_size), -(-width // block_size)
+        padding = ((0, rows * block_size - height), (0, cols * block_size - width))
+        changed = np.pad((before != after).any(axis=2), padding)
+        blocks = changed.reshape(rows, block_size, cols, block_size).any(axis=(1, 3))
+
+        _, _, stats, _ = cv2.connectedComponentsWithStats(blocks.astype(np.uint8))
+        regions = []
+        for col, row, block_cols, block_rows, _ in stats[1:]:
+            x, y = col * block_size, row * block_size
+            regions.append(
+                (
+                    int(x),
+                    int(y),
+                    int(min(block_cols * block_size, width - x)),
+                    int(min(block_rows * block_size, height - y)),
+                )
+            )
 
-            # Save diff image
-            cv2.imwrite(diff_path, diff)
+        logger.info(f"Changed regions found: {len(regions)}")
+        return regions
+
+    def check_regions_batch(
+        self,
+        page_name: str,
+        driver: WebDriver,
+        regions: dict[str, tuple[int, int, int, int]],
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Compare many regions of a page with their baselines in one pass
+
+        Screenshots the same size as their baselines are stacked and diffed
+        together, so a grid of equal cards costs one comparison rather than one
+        per card. Counts match those of check_page_layout's local comparison.
+        A region without a baseline of its size falls back to the single-image
+        check. Only the local comparison runs: Applitools and the result caches
+        are skipped.
+
+        Args:
+            page_name: Page name, prefixed to each region's baseline name
+            driver: WebDriver
+            regions: Regions to check (x, y, width, height) by element name, so
+                a region that moves keeps its baseline
+
+        Returns:
+            Local check result for each element name
+        """
+        names = [f"{page_name}_{name}" for name in regions]
+        screenshots = [
+            self._take_screenshot(driver, region) for region in regions.values()
+        ]
+        results: list[dict[str, Any]] = [{} for _ in regions]
+
+        # Group regions by size so each group diffs as one stack
+        groups: dict[tuple[int, ...], list[tuple[int, np.ndarray]]] = {}
+        for index, (name, screenshot) in enumerate(zip(names, screenshots)):
+            baseline_path = os.path.join(self.baseline_dir, f"{name}.png")
+            baseline = None
+            if os.path.exists(baseline_path):
+                baseline, _ = self._load_baseline(baseline_path)
+            if baseline is None or baseline.shape != screenshot.shape:
+                results[index] = self._check_with_custom_algorithm(name, screenshot)
+            else:
+                groups.setdefault(screenshot.shape, []).append((index, baseline))
+
+        for shape, members in groups.items():
+            indices = [index for index, _ in members]
+
+            # Per-pixel operations treat the stack as one tall image
+            baselines = np.concatenate([baseline for _, baseline in members])
+            currents = np.concatenate([screenshots[index] for index in indices])
+            diff, thresh = self._diff_mask(baselines, currents)
+            height = shape[0]
+            changes = self._pool_changes(thresh.reshape(len(indices), height, -1))
+            total_pixels = changes[0].size
+            counts = np.count_nonzero(changes, axis=(1, 2)).tolist()
+
+            for offset, (index, changed_pixels) in enumerate(zip(indices, counts)):
+                differences = {
+                    "changed_pixels": changed_pixels,
+                    "difference_percentage": changed_pixels / total_pixels * 100,
+                }
+                if changed_pixels == 0:
+                    results[index] = {"status": "passed", "differences": differences}
+                    continue
+
+                diff_path = os.path.join(
+                    self.diff_dir,
+                    f"{names[index]}_diff_{self._image_id(screenshots[index])}.png",
+                )
+                region_diff = diff[offset * height : (offset + 1) * height]
+                self._save_diff_image(region_diff.copy(), diff_path)
+                results[index] = {
+                    "status": "failed",
+                    "differences": differences,
+                    "diff_image": diff_path,
+                }
+
+        for name, screenshot, result in zip(names, screenshots, results):
+            if settings.persist_screenshots or result.get("status") == "failed":
+                self._save_screenshot(name, screenshot)
+
+        failed = sum(result.get("status") == "failed" for result in results)
+        logger.info(f"Region batch for {page_name}: {failed}/{len(regions)} failed")
+        return dict(zip(regions, results))
+
+    def _save_diff_image(self, diff: np.ndarray | None, diff_path: str):
+        """Save difference image computed by _compare_images"""
+        try:
+            if diff is None:
+                return
+
+            self._write_image(diff_path, diff)
             logger.info(f"Diff image saved: {diff_path}")
 
         except Exception as e:
@@ -377,28 +943,27 @@ class VisualTester:
     def _analyze_element_visibility(self, screenshot_data: bytes) -> dict[str, Any]:
         """Analyze element visibility from screenshot"""
         try:
-            # Convert bytes to numpy array
+            # Decode straight to grayscale
             nparr = np.frombuffer(screenshot_data, np.uint8)
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            gray = cv2.imdecode(nparr, cv2.IMREAD_GRAYSCALE)
 
-            if image is None:
+            if gray is None:
                 return {"visibility_score": 0.0, "error": "Failed to decode image"}
 
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
-            # Calculate brightness
-            brightness = np.mean(gray)
-
-            # Calculate contrast
-            contrast = np.std(gray)
+            # Calculate brightness and contrast in one pass
+            mean, std = cv2.meanStdDev(gray)
+            brightness = float(mean[0, 0])
+            contrast = float(std[0, 0])
 
             # Detect text
-            text_detected = self._detect_text(image)
-
-            # Calculate visibility score
-            visibility_score = self._calculate_visibility_score(
-                brightness, contrast, text_detected
+            text_detected = self._detect_text(gray)
+
+            # Weigh normalized brightness and contrast, plus a bonus for text
+            visibility_score = min(
+                min(brightness / 255.0, 1.0) * 0.4
+                + min(contrast / 255.0, 1.0) * 0.4
+                + (0.2 if text_detected else 0.0),
+                1.0,
             )
 
             return {
@@ -406,56 +971,36 @@ class VisualTester:
                 "brightness": brightness,
                 "contrast": contrast,
                 "text_detected": text_detected,
-                "image_size": image.shape,
+                "image_size": gray.shape,
             }
 
         except Exception as e:
             logger.error(f"Error analyzing element visibility: {e}")
             return {"visibility_score": 0.0, "error": str(e)}
 
-    def _detect_text(self, image: np.ndarray) -> bool:
-        """Detect if image contains text"""
+    def _detect_text(self, gray: np.ndarray) -> bool:
+        """Detect if a grayscale image contains text"""
         try:
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-
             # Apply threshold to find text-like regions
             _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
 
-            # Find contours
-            contours, _ = cv2.findContours(
-                thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+            # Bounding boxes of all foreground regions, skipping the background
+            _, _, stats, _ = cv2.connectedComponentsWithStats(thresh)
+            w = stats[1:, cv2.CC_STAT_WIDTH]
+            h = stats[1:, cv2.CC_STAT_HEIGHT]
+            aspect_ratio = w / np.maximum(h, 1)
+
+            # Check if any region looks like text (small, rectangular)
+            text_like = (
+                (0.1 < aspect_ratio)
+                & (aspect_ratio < 10)
+                & (10 < w)
+                & (w < 200)
+                & (5 < h)
+                & (h < 50)
             )
-
-            # Check if any contour looks like text (small, rectangular)
-            for contour in contours:
-                x, y, w, h = cv2.boundingRect(contour)
-                aspect_ratio = w / h if h > 0 else 0
-
-                # Text-like characteristics
-                if 0.1 < aspect_ratio < 10 and 10 < w < 200 and 5 < h < 50:
-                    return True
-
-            return False
+            return bool(text_like.any())
 
         except Exception as e:
             logger.error(f"Error detecting text: {e}")
             return False
-
-    def _calculate_visibility_score(
-        self, brightness: float, contrast: float, text_detected: bool
-    ) -> float:
-        """Calculate visibility score from metrics"""
-        # Normalize brightness (0-255 to 0-1)
-        brightness_score = min(brightness / 255.0, 1.0)
-
-        # Normalize contrast (0-255 to 0-1)
-        contrast_score = min(contrast / 255.0, 1.0)
-
-        # Text bonus
-        text_bonus = 0.2 if text_detected else 0.0
-
-        # Calculate final score
-        visibility_score = brightness_score * 0.4 + contrast_score * 0.4 + text_bonus
-
-        return min(visibility_score, 1.0)
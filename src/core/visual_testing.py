@@ -8,7 +8,6 @@ from typing import Any
 import cv2
 import numpy as np
 from loguru import logger
-from PIL import Image, ImageChops
 
 from src.core.constants import SCREENSHOT_DIR
 
@@ -96,17 +95,8 @@ class VisualTester:
     ) -> str:
         """Create difference image"""
         try:
-            # Convert to PIL images for difference calculation
-            baseline_pil = Image.fromarray(
-                cv2.cvtColor(baseline_img, cv2.COLOR_BGR2RGB)
-            )
-            current_pil = Image.fromarray(cv2.cvtColor(current_img, cv2.COLOR_BGR2RGB))
-
             # Calculate difference
-            diff = ImageChops.difference(baseline_pil, current_pil)
-
-            # Convert back to OpenCV format
-            diff_cv = cv2.cvtColor(np.array(diff), cv2.COLOR_RGB2BGR)
+            diff_cv = cv2.absdiff(baseline_img, current_img)
 
             # Save difference image
             baseline_name = Path(baseline_path).stem
@@ -10,6 +10,14 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from src.ui.pages.base_home_page import BaseHomePage
 
+# Name and price of every product card that has both
+FEATURED_PRODUCTS_SCRIPT = """
+return Array.from(document.querySelectorAll(".single-products .productinfo"))
+    .map(info => [info.querySelector("p"), info.querySelector("h2")])
+    .filter(([name, price]) => name && price)
+    .map(([name, price]) => ({name: name.innerText, price: price.innerText}));
+"""
+
 
 class AutomationExerciseHomePage(BaseHomePage):
     """Page Object for Automation Exercise Home Page"""
@@ -56,6 +64,13 @@ class AutomationExerciseHomePage(BaseHomePage):
 
     def __init__(self, driver):
         super().__init__(driver, "https://automationexercise.com/")
+        # (url, products) of the last scrape, reused while the page is unchanged
+        self._featured_products_cache = None
+
+    def open_home_page(self) -> None:
+        """Open the home page, discarding products scraped from earlier loads"""
+        self._featured_products_cache = None
+        super().open_home_page()
 
     def get_expected_title(self) -> str:
         """Get expected page title"""
@@ -117,23 +132,29 @@ class AutomationExerciseHomePage(BaseHomePage):
         return self
 
     def get_featured_products(self):
-        """Get list of featured products"""
-        logger.info("Getting featured products")
-        products = self.find_elements(self.PRODUCTS)
-        product_list = []
+        """Get list of featured products, cached for the current page load"""
+        current_url = self.driver.current_url
+        if self._featured_products_cache:
+            cached_url, cached_products = self._featured_products_cache
+            if cached_url == current_url:
+                logger.info("Using cached featured products")
+                return list(cached_products)
 
-        for product in products:
-            try:
-                name_element = product.find_element(By.CSS_SELECTOR, ".productinfo p")
-                price_element = product.find_element(By.CSS_SELECTOR, ".productinfo h2")
-
-                product_list.append(
-                    {"name": name_element.text, "price": price_element.text}
-                )
-            except Exception:
-                logger.warning("Could not get product info")
-
-        return product_list
+        logger.info("Getting featured products")
+        # Wait for the grid, then read every card in a single script call
+        self.find_elements(self.PRODUCTS)
+        product_list = self.driver.execute_script(FEATURED_PRODUCTS_SCRIPT)
+
+        self._featured_products_cache = (current_url, product_list)
+        return list(product_list)
+
+    def get_product_names(self) -> list[str]:
+        """Get names of the listed products in one script call"""
+        return self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]),"
+            " el => el.textContent.trim())",
+            self.PRODUCT_NAMES[1],
+        )
 
     def subscribe_to_newsletter(self, email: str):
         """Subscribe to newsletter"""
@@ -3,9 +3,12 @@ Base class for Page Object Model
 """
 
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 from loguru import logger
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
@@ -13,6 +16,18 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from src.core.config.settings import settings
 
+# Evaluates every [strategy, selector] pair in the page in one round-trip
+ELEMENTS_VISIBLE_SCRIPT = """
+return arguments[0].map(([strategy, selector]) => {
+    const el = strategy === "xpath"
+        ? document.evaluate(selector, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(selector);
+    return !!el && el.getClientRects().length > 0
+        && getComputedStyle(el).visibility !== "hidden";
+});
+"""
+
 
 class BasePage:
     """Base class for all pages"""
@@ -33,6 +48,16 @@ class BasePage:
         logger.info(f"Opening page: {full_url}")
         self.driver.get(full_url)
 
+    def open_home_page(self) -> None:
+        """Opens the home page at base_url"""
+        self.open()
+        self.wait_for_page_load()
+
+    def ensure_home_page(self) -> None:
+        """Opens the home page unless the browser is already on it"""
+        if self.driver.current_url.rstrip("/") != self.base_url.rstrip("/"):
+            self.open_home_page()
+
     def get_title(self) -> str:
         """Gets page title"""
         return self.driver.title
@@ -191,6 +216,34 @@ class BasePage:
         except (TimeoutException, NoSuchElementException):
             return False
 
+    def are_elements_visible(self, locators: list[tuple]) -> list[bool]:
+        """
+        Checks visibility of several elements with a single script call
+
+        Args:
+            locators: Element locators (CSS selector, ID, class name,
+                tag name, name or XPath)
+
+        Returns:
+            Visibility flag for each locator, in order
+        """
+        selectors = [self._to_script_selector(locator) for locator in locators]
+        return self.driver.execute_script(ELEMENTS_VISIBLE_SCRIPT, selectors)
+
+    @staticmethod
+    def _to_script_selector(locator: tuple) -> list[str]:
+        """Converts a locator to a [strategy, selector] pair for the page script"""
+        by, value = locator
+        if by == By.XPATH:
+            return ["xpath", value]
+        if by == By.ID:
+            return ["css", f"#{value}"]
+        if by == By.CLASS_NAME:
+            return ["css", f".{value}"]
+        if by == By.NAME:
+            return ["css", f"[name='{value}']"]
+        return ["css", value]
+
     def wait_for_element_visible(
         self, locator: tuple, timeout: int = None
     ) -> WebElement:
@@ -299,6 +352,23 @@ class BasePage:
         except TimeoutException:
             logger.warning("Page load timeout")
 
+    @contextmanager
+    def wait_for_navigation(self, timeout: int = None) -> Iterator[None]:
+        """
+        Waits for the actions in the block to replace the current document
+
+        The old document's root goes stale as soon as the new one commits,
+        which fires earlier than polling the URL.
+
+        Args:
+            timeout: Wait timeout
+        """
+        old_root = self.driver.find_element(By.TAG_NAME, "html")
+        yield
+        wait_time = timeout or settings.browser_timeout
+        WebDriverWait(self.driver, wait_time).until(EC.staleness_of(old_root))
+        logger.debug("Navigated to new page")
+
     def refresh_page(self) -> None:
         """Refreshes the page"""
         self.driver.refresh()
@@ -9,6 +9,9 @@ from selenium.webdriver.common.by import By
 
 from src.ui.pages.base_page import BasePage
 
+# URL paths of pages that show the category sidebar
+CATEGORY_PAGES = ("/products", "/category_products/")
+
 
 class HomePage(BasePage):
     """Class for working with home page"""
@@ -51,16 +54,17 @@ class HomePage(BasePage):
     FOOTER_LINKS = (By.CSS_SELECTOR, ".footer-widget a")
     NEWSLETTER_INPUT = (By.ID, "susbscribe_email")
     NEWSLETTER_SUBMIT = (By.ID, "subscribe")
+    NEWSLETTER_SUCCESS = (By.ID, "success-subscribe")
     COPYRIGHT_TEXT = (By.CSS_SELECTOR, ".footer-bottom p")
     BACK_TO_TOP_BUTTON = (By.CSS_SELECTOR, "#scrollUp")
 
     def __init__(self, driver):
         super().__init__(driver)
-        self.url = "https://automationexercise.com/"
+        self.base_url = "https://automationexercise.com/"
 
     def open_home_page(self):
         """Opens home page"""
-        self.driver.get(self.url)
+        self.driver.get(self.base_url)
         self.wait_for_page_load()
         logger.info("Home page opened")
 
@@ -110,9 +114,11 @@ class HomePage(BasePage):
         Args:
             category: Category name
         """
-        # First navigate to products page where categories are located
-        self.driver.get("https://automationexercise.com/products")
-        self.wait_for_page_load()
+        # Categories are in the sidebar of the products and category pages,
+        # so only navigate when the browser is elsewhere
+        if not any(page in self.driver.current_url for page in CATEGORY_PAGES):
+            self.driver.get("https://automationexercise.com/products")
+            self.wait_for_page_load()
 
         category_panels = {
             "women": self.WOMEN_PANEL,
@@ -251,16 +257,19 @@ class HomePage(BasePage):
 
     def verify_page_elements(self) -> dict:
         """Checks presence of main page elements"""
-        elements_status = {
-            "logo": self.is_element_visible(self.LOGO),
-            "search": self.is_element_visible(self.SEARCH_INPUT),
-            "cart": self.is_element_visible(self.CART_ICON),
-            "login": self.is_element_visible(self.LOGIN_BUTTON),
-            "register": self.is_element_visible(self.REGISTER_BUTTON),
-            "banner": self.is_element_visible(self.MAIN_BANNER),
-            "featured_products": self.is_element_visible(self.FEATURED_PRODUCTS),
-            "footer": self.is_element_visible(self.FOOTER),
+        locators = {
+            "logo": self.LOGO,
+            "search": self.SEARCH_INPUT,
+            "cart": self.CART_ICON,
+            "login": self.LOGIN_BUTTON,
+            "register": self.REGISTER_BUTTON,
+            "banner": self.MAIN_BANNER,
+            "featured_products": self.FEATURED_PRODUCTS,
+            "footer": self.FOOTER,
         }
+        # One script call instead of a wait and lookup per element
+        visibility = self.are_elements_visible(list(locators.values()))
+        elements_status = dict(zip(locators, visibility))
 
         logger.info(f"Page elements status: {elements_status}")
         return elements_status
@@ -5,7 +5,6 @@ Page Object for https://demo.nopcommerce.com/
 
 from loguru import logger
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from src.ui.pages.base_page import BasePage
@@ -40,24 +39,25 @@ class NopCommerceHomePage(BasePage):
     # Newsletter
     NEWSLETTER_EMAIL = (By.ID, "newsletter-email")
     NEWSLETTER_SUBSCRIBE_BUTTON = (By.ID, "newsletter-subscribe-button")
+    NEWSLETTER_RESULT = (By.ID, "newsletter-result-block")
 
     def __init__(self, driver):
         super().__init__(driver)
-        self.url = "https://demo.nopcommerce.com/"
+        self.base_url = "https://demo.nopcommerce.com/"
 
     def open_home_page(self):
         """Open the home page"""
-        logger.info(f"Opening nopCommerce home page: {self.url}")
-        self.driver.get(self.url)
+        logger.info(f"Opening nopCommerce home page: {self.base_url}")
+        self.driver.get(self.base_url)
 
         # Wait for Cloudflare protection to pass
         logger.info("Waiting for Cloudflare protection to pass...")
         try:
-            # Wait for "Just a moment..." to disappear
-            WebDriverWait(self.driver, 30).until_not(
-                EC.presence_of_element_located(
-                    (By.XPATH, "//*[contains(text(), 'Just a moment')]")
-                )
+            # Wait for the "Just a moment..." challenge page to go away. The
+            # title is checked instead of the DOM, which would wait out the
+            # implicit wait on every poll once the text is gone
+            WebDriverWait(self.driver, 30).until(
+                lambda driver: "Just a moment" not in driver.title
             )
             logger.info("Cloudflare protection passed")
         except Exception as e:
@@ -148,6 +148,14 @@ class NopCommerceHomePage(BasePage):
         self.click_element(self.NEWSLETTER_SUBSCRIBE_BUTTON)
         return self
 
+    def get_newsletter_result_text(self):
+        """Get newsletter result message, empty if none is shown"""
+        return self.driver.execute_script(
+            "const el = document.getElementById(arguments[0]);"
+            " return el ? el.innerText : '';",
+            self.NEWSLETTER_RESULT[1],
+        )
+
     def get_page_title(self):
         """Get page title"""
         return self.driver.title
@@ -182,6 +182,25 @@ class UIHelpers:
             logger.warning("Page load timeout")
             return False
 
+    def get_page_load_time(self, timeout: int = DEFAULT_TIMEOUT) -> int:
+        """
+        Get page load time in milliseconds from the Navigation Timing API
+
+        Measured by the browser itself, so WebDriver round-trips are excluded.
+        """
+        WebDriverWait(self.driver, timeout).until(
+            lambda driver: driver.execute_script(
+                "return performance.timing.loadEventEnd"
+            )
+            > 0
+        )
+        load_time = self.driver.execute_script(
+            "return performance.timing.loadEventEnd"
+            " - performance.timing.navigationStart"
+        )
+        logger.info(f"Page load time: {load_time}ms")
+        return load_time
+
     def wait_for_url_change(
         self, current_url: str, timeout: int = DEFAULT_TIMEOUT
     ) -> bool:
@@ -6,6 +6,8 @@ import time
 from abc import ABC, abstractmethod
 
 from loguru import logger
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 
 class BaseHomePageTest(ABC):
@@ -26,6 +28,16 @@ class BaseHomePageTest(ABC):
         """Get expected page URL - to be implemented by subclasses"""
         pass
 
+    def _wait_for_url_contains(self, fragment: str, timeout: int = 10):
+        """Wait until the current URL contains the given fragment"""
+        driver = self.get_home_page().driver
+        WebDriverWait(driver, timeout).until(EC.url_contains(fragment))
+
+    def _wait_for_url_change(self, url: str, timeout: int = 10):
+        """Wait until the current URL differs from the given URL"""
+        driver = self.get_home_page().driver
+        WebDriverWait(driver, timeout).until(EC.url_changes(url))
+
     def test_home_page_load(self):
         """Common test for home page load"""
         logger.info("Testing home page load")
@@ -2,26 +2,77 @@
 Pytest configuration and fixtures for SmartShop AI Test Framework
 """
 
+import copy
+import functools
 import os
+import shutil
+import socket
+import subprocess
 import sys
+import tempfile
 import time
+import uuid
+from urllib.parse import urlparse
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 import pytest
+import requests
 from loguru import logger
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 
 from src.core.config.settings import settings
-from src.core.utils.ai_data_generator import AIDataGenerator
-from src.core.utils.visual_testing import VisualTester
+
+# Third-party requests the tests never assert on (fonts, analytics, ads)
+BLOCKED_URL_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*fonts.googleapis.com*",
+    "*fonts.gstatic.com*",
+    "*facebook.net*",
+]
+
+# Static assets additionally blocked with --fast-ui (images, web fonts, media)
+FAST_UI_BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.mp4",
+]
+
+# Window size every driver starts with and is reset to between tests
+DEFAULT_WINDOW_SIZE = {"width": 1920, "height": 1080}
+
+# Clears web storage; pages such as about:blank deny access to it
+CLEAR_STORAGE_SCRIPT = """
+try {
+    window.localStorage.clear();
+    window.sessionStorage.clear();
+} catch (e) {}
+"""
+
+# Chrome process shared by all xdist workers when --shared-chrome is set
+SHARED_CHROME_ADDRESS = ("127.0.0.1", 9222)
+SHARED_CHROME_PROFILE_DIR = os.path.join(tempfile.gettempdir(), "smartshop-chrome")
+_shared_chrome_process = None
+
+# ChromeDriver path resolved once per process by _chromedriver_path
+_chromedriver_path_cache = None
 
 
 def pytest_addoption(parser):
@@ -41,6 +92,18 @@ def pytest_addoption(parser):
     parser.addoption(
         "--url", action="store", default=settings.base_url, help="Base URL for testing"
     )
+    parser.addoption(
+        "--shared-chrome",
+        action="store_true",
+        default=False,
+        help="Launch Chrome once and attach every worker to it in its own tab",
+    )
+    parser.addoption(
+        "--fast-ui",
+        action="store_true",
+        default=settings.block_assets,
+        help="Skip loading images, web fonts and media in Chromium-based browsers",
+    )
 
 
 @pytest.fixture(scope="session")
@@ -61,67 +124,226 @@ def base_url(request):
     return request.config.getoption("--url")
 
 
-@pytest.fixture(scope="function")
-def driver(browser_type, headless_mode, base_url):
+@pytest.fixture(scope="session")
+def host_resolver_rules(base_url):
     """
-    WebDriver fixture that provides a browser instance for each test
+    Resolve the application host once per session
+
+    The returned Chrome host resolver rule pins the host to its address so
+    browsers started later in the session skip the DNS lookup.
     """
-    driver = None
+    return _resolve_host_resolver_rules(base_url)
+
+
+def _resolve_host_resolver_rules(base_url):
+    """Build a Chrome host resolver rule pinning the base URL host"""
+    host = urlparse(base_url).hostname
+    if not host:
+        return None
 
     try:
-        if browser_type.lower() == "chrome":
-            driver = _setup_chrome_driver(headless_mode)
-        elif browser_type.lower() == "firefox":
-            driver = _setup_firefox_driver(headless_mode)
-        elif browser_type.lower() == "edge":
-            driver = _setup_edge_driver(headless_mode)
+        ip_address = socket.gethostbyname(host)
+    except OSError as e:
+        logger.warning(f"Failed to pre-resolve {host}: {e}")
+        return None
+
+    logger.info(f"Pinned {host} to {ip_address}")
+    return f"MAP {host} {ip_address}"
+
+
+@pytest.fixture(scope="session")
+def driver(
+    request, browser_type, headless_mode, base_url, host_resolver_rules, worker_id
+):
+    """
+    WebDriver fixture that provides one browser instance per session
+
+    Browser startup dominates UI test runtime, so the instance is shared by
+    all tests of a session (one per xdist worker) and state is reset between
+    tests by ``_reset_browser_state``.
+    """
+    fast_ui = request.config.getoption("--fast-ui")
+    shared_chrome = (
+        request.config.getoption("--shared-chrome")
+        and browser_type.lower() == "chrome"
+        and _is_shared_chrome_running()
+    )
+
+    try:
+        if shared_chrome:
+            driver = _attach_to_shared_chrome(fast_ui)
         else:
-            logger.warning(f"Unsupported browser: {browser_type}, using Chrome")
-            driver = _setup_chrome_driver(headless_mode)
+            # Namespace the profile per xdist worker so parallel browsers
+            # do not collide on the same user data directory
+            user_data_dir = os.path.join(
+                tempfile.gettempdir(), f"smartshop-chrome-{worker_id}"
+            )
+            driver = _build_driver(
+                browser_type,
+                headless_mode,
+                host_resolver_rules,
+                user_data_dir,
+                fast_ui,
+            )
+    except Exception as e:
+        logger.error(f"❌ Failed to initialize WebDriver: {e}")
+        raise
+
+    request.addfinalizer(lambda: _quit_driver(driver, close_window=shared_chrome))
+
+    # Later page loads in the session reuse the assets fetched here
+    _warm_http_cache(driver, base_url)
+
+    logger.info(f"✅ WebDriver initialized: {browser_type} (headless: {headless_mode})")
 
-        # Set window size
-        driver.set_window_size(1920, 1080)
+    yield driver
 
-        # Set implicit wait
-        driver.implicitly_wait(settings.implicit_wait)
 
-        # Set page load timeout
-        driver.set_page_load_timeout(settings.browser_timeout)
+@pytest.fixture(autouse=True)
+def _reset_browser_state(request):
+    """Reset shared browser state after each test that used the driver"""
+    yield
+
+    if "driver" not in request.fixturenames:
+        return
+
+    driver = request.getfixturevalue("driver")
+    try:
+        driver.delete_all_cookies()
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        # Resizing forces a reflow, so only restore windows a test changed
+        if driver.get_window_size() != DEFAULT_WINDOW_SIZE:
+            driver.set_window_size(**DEFAULT_WINDOW_SIZE)
+    except Exception as e:
+        logger.warning(f"⚠️ Error resetting browser state: {e}")
 
-        logger.info(
-            f"✅ WebDriver initialized: {browser_type} (headless: {headless_mode})"
+
+@pytest.fixture
+def window_size(request, driver):
+    """
+    Resize the browser for one test, parametrized indirectly with (width, height)
+
+    The window is only resized when it differs from the requested size, and the
+    fixture returns once the page reports the new width.
+    """
+    width, height = request.param
+    if driver.get_window_size() != {"width": width, "height": height}:
+        driver.set_window_size(width, height)
+        WebDriverWait(driver, 5).until(
+            lambda d: d.execute_script("return window.outerWidth") == width
+        )
+    return width, height
+
+
+def _build_driver(
+    browser_type,
+    headless_mode,
+    host_resolver_rules=None,
+    user_data_dir=None,
+    fast_ui=False,
+):
+    """Create and configure a WebDriver for the requested browser"""
+    if browser_type.lower() == "chrome":
+        driver = _setup_chrome_driver(
+            headless_mode, host_resolver_rules, user_data_dir, fast_ui
         )
+    elif browser_type.lower() == "firefox":
+        driver = _setup_firefox_driver(headless_mode)
+    elif browser_type.lower() == "edge":
+        driver = _setup_edge_driver(headless_mode)
+    else:
+        logger.warning(f"Unsupported browser: {browser_type}, using Chrome")
+        driver = _setup_chrome_driver(
+            headless_mode, host_resolver_rules, user_data_dir, fast_ui
+        )
+
+    # Block third-party requests on Chromium-based browsers
+    if hasattr(driver, "execute_cdp_cmd"):
+        _block_third_party_urls(driver, fast_ui)
+
+    # Set window size
+    driver.set_window_size(**DEFAULT_WINDOW_SIZE)
+
+    # Set implicit wait
+    driver.implicitly_wait(settings.implicit_wait)
 
-        yield driver
+    # Set page load timeout
+    driver.set_page_load_timeout(settings.browser_timeout)
 
+    return driver
+
+
+def _block_third_party_urls(driver, fast_ui=False):
+    """Block third-party URLs through the Chrome DevTools Protocol"""
+    urls = BLOCKED_URL_PATTERNS
+    if fast_ui:
+        urls = BLOCKED_URL_PATTERNS + FAST_UI_BLOCKED_URL_PATTERNS
+
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
     except Exception as e:
-        logger.error(f"❌ Failed to initialize WebDriver: {e}")
-        raise
-    finally:
-        if driver:
-            try:
-                driver.quit()
-                logger.info("✅ WebDriver closed")
-            except Exception as e:
-                logger.warning(f"⚠️ Error closing WebDriver: {e}")
+        logger.warning(f"Failed to block third-party URLs: {e}")
+
+
+def _warm_http_cache(driver, base_url):
+    """Load the base URL once so later page loads hit the HTTP cache"""
+    try:
+        if hasattr(driver, "execute_cdp_cmd"):
+            driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+        driver.get(base_url)
+    except Exception as e:
+        logger.warning(f"Failed to warm HTTP cache: {e}")
 
 
-def _setup_chrome_driver(headless_mode):
+def _quit_driver(driver, close_window=False):
+    """Close WebDriver, logging instead of raising on failure"""
+    try:
+        # Attached sessions leave the shared browser running, so close the tab
+        if close_window:
+            driver.close()
+        driver.quit()
+        logger.info("✅ WebDriver closed")
+    except Exception as e:
+        logger.warning(f"⚠️ Error closing WebDriver: {e}")
+
+
+def _setup_chrome_driver(
+    headless_mode, host_resolver_rules=None, user_data_dir=None, fast_ui=False
+):
     """Setup Chrome WebDriver"""
     options = Options()
 
     if headless_mode:
-        options.add_argument("--headless")
+        options.add_argument("--headless=new")
 
     # Additional Chrome options for stability
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--disable-extensions")
+    # Keep background tabs and idle services from competing with the test
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--disable-renderer-backgrounding")
+    options.add_argument("--disable-backgrounding-occluded-windows")
     options.add_argument("--disable-plugins")
     options.add_argument("--disable-images")  # Speed up tests
 
+    # Return from driver.get() at DOMContentLoaded; tests wait explicitly
+    # for the elements they assert on
+    options.page_load_strategy = "eager"
+
+    # Skip DNS lookups for hosts resolved at session start
+    if host_resolver_rules:
+        options.add_argument(f"--host-resolver-rules={host_resolver_rules}")
+
+    if user_data_dir:
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+
+    # Tests that do not assert on images can skip decoding them entirely
+    if fast_ui:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+
     # Set user agent
     options.add_argument(
         "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
@@ -129,7 +351,7 @@ def _setup_chrome_driver(headless_mode):
 
     try:
         # Try to use webdriver-manager for automatic driver management
-        service = Service(ChromeDriverManager().install())
+        service = Service(_chromedriver_path())
         driver = webdriver.Chrome(service=service, options=options)
     except Exception as e:
         logger.warning(f"Failed to use webdriver-manager: {e}")
@@ -139,6 +361,92 @@ def _setup_chrome_driver(headless_mode):
     return driver
 
 
+def _chromedriver_path():
+    """Resolve the ChromeDriver binary once instead of on every driver start"""
+    global _chromedriver_path_cache
+    if _chromedriver_path_cache is None:
+        _chromedriver_path_cache = ChromeDriverManager().install()
+    return _chromedriver_path_cache
+
+
+def _launch_shared_chrome(headless_mode, host_resolver_rules=None):
+    """Launch a Chrome process with remote debugging for workers to attach to"""
+    binary = (
+        os.environ.get("CHROME_BINARY")
+        or shutil.which("google-chrome")
+        or shutil.which("chromium")
+    )
+    if not binary:
+        logger.warning("Chrome binary not found, workers will start their own")
+        return None
+
+    args = [
+        binary,
+        f"--remote-debugging-port={SHARED_CHROME_ADDRESS[1]}",
+        f"--user-data-dir={SHARED_CHROME_PROFILE_DIR}",
+        "--no-first-run",
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-background-networking",
+        "--disable-renderer-backgrounding",
+        "--disable-backgrounding-occluded-windows",
+        "--window-size=1920,1080",
+    ]
+    if headless_mode:
+        args.append("--headless=new")
+    if host_resolver_rules:
+        args.append(f"--host-resolver-rules={host_resolver_rules}")
+
+    process = subprocess.Popen(
+        args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    # Wait for the debugging port before workers try to attach
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        if _is_shared_chrome_running():
+            logger.info(
+                f"✅ Shared Chrome listening on port {SHARED_CHROME_ADDRESS[1]}"
+            )
+            return process
+        time.sleep(0.1)
+
+    logger.warning("Shared Chrome did not open its debugging port")
+    process.terminate()
+    return None
+
+
+def _is_shared_chrome_running():
+    """Check whether the shared Chrome debugging port accepts connections"""
+    try:
+        socket.create_connection(SHARED_CHROME_ADDRESS, timeout=1).close()
+        return True
+    except OSError:
+        return False
+
+
+def _attach_to_shared_chrome(fast_ui=False):
+    """Attach a WebDriver session to the shared Chrome in a new tab"""
+    options = Options()
+    options.debugger_address = "{}:{}".format(*SHARED_CHROME_ADDRESS)
+    options.page_load_strategy = "eager"
+
+    try:
+        service = Service(_chromedriver_path())
+        driver = webdriver.Chrome(service=service, options=options)
+    except Exception as e:
+        logger.warning(f"Failed to use webdriver-manager: {e}")
+        driver = webdriver.Chrome(options=options)
+
+    # Give every attached session its own tab
+    driver.switch_to.new_window("tab")
+
+    _block_third_party_urls(driver, fast_ui)
+    driver.implicitly_wait(settings.implicit_wait)
+    driver.set_page_load_timeout(settings.browser_timeout)
+    return driver
+
+
 def _setup_firefox_driver(headless_mode):
     """Setup Firefox WebDriver"""
     options = FirefoxOptions()
@@ -151,6 +459,9 @@ def _setup_firefox_driver(headless_mode):
     options.add_argument("--height=1080")
     options.add_argument("--disable-extensions")
 
+    # Return from driver.get() at DOMContentLoaded, as on Chrome
+    options.page_load_strategy = "eager"
+
     try:
         # Try to use webdriver-manager for automatic driver management
         service = FirefoxService(GeckoDriverManager().install())
@@ -180,6 +491,9 @@ def _setup_edge_driver(headless_mode):
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--window-size=1920,1080")
 
+        # Return from driver.get() at DOMContentLoaded, as on Chrome
+        options.page_load_strategy = "eager"
+
         try:
             service = EdgeService(EdgeChromiumDriverManager().install())
             driver = webdriver.Edge(service=service, options=options)
@@ -193,21 +507,160 @@ def _setup_edge_driver(headless_mode):
         return _setup_chrome_driver(headless_mode)
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def ai_generator():
-    """AI Data Generator fixture"""
+    """AI Data Generator fixture, shared by the session as it holds no test state"""
+    # Imported lazily: openai and faker are slow to import and every xdist
+    # worker loads this conftest during collection
+    from src.core.utils.ai_data_generator import AIDataGenerator
+
     return AIDataGenerator()
 
 
+@pytest.fixture(scope="session")
+def ai_user(ai_generator):
+    """Customer profile generated once for tests that only display its data"""
+    return ai_generator.generate_user_profile("customer")
+
+
+@pytest.fixture(scope="session")
+def ai_product_catalog(ai_generator):
+    """
+    Product catalog generator memoized per (category, count) for the session
+
+    Each call returns a deep copy, so a test that edits a product cannot change
+    what later tests on the worker receive.
+    """
+    generate = functools.lru_cache(maxsize=None)(ai_generator.generate_product_catalog)
+
+    def catalog(category="electronics", count=10):
+        return copy.deepcopy(generate(category, count))
+
+    return catalog
+
+
+@pytest.fixture
+def unique_email(ai_user):
+    """Shared customer email made unique per test with a short random suffix"""
+    local_part, domain = ai_user["email"].split("@", 1)
+    return f"{local_part}+{uuid.uuid4().hex[:6]}@{domain}"
+
+
 @pytest.fixture(scope="function")
-def visual_tester():
+def visual_tester(request):
     """Visual Tester fixture"""
-    return VisualTester()
+    from src.core.utils.visual_testing import VisualTester
+
+    # Visual checks compare rendered images, which --fast-ui never loads
+    if request.config.getoption("--fast-ui"):
+        pytest.skip("Visual checks need images; run without --fast-ui")
+
+    visual_tester = VisualTester()
+    yield visual_tester
+    not_passed = visual_tester.close()
+    assert not not_passed, f"Applitools tests did not pass: {not_passed}"
+
+
+@pytest.fixture(scope="session")
+def _element_visibility_cache():
+    """Passed element visibility analyses, keyed by page load"""
+    return {}
+
+
+@pytest.fixture
+def element_visibility(visual_tester, _element_visibility_cache):
+    """
+    Element visibility check memoized per page load, selector and window size
+
+    A page load is identified by its performance.timeOrigin, so a verdict is
+    only reused while the same document is still loaded; a reload or a new
+    navigation checks the element again. Only passed results are cached, so
+    a rerun after an error checks the element again.
+    """
+
+    def check(driver, selector):
+        size = driver.get_window_size()
+        time_origin = driver.execute_script("return performance.timeOrigin;")
+        key = (driver.current_url, time_origin, selector, size["width"], size["height"])
+        if key in _element_visibility_cache:
+            return _element_visibility_cache[key]
+
+        result = visual_tester.check_element_visibility(driver, selector)
+        if result["status"] == "passed":
+            _element_visibility_cache[key] = result
+        return result
+
+    return check
+
+
+@pytest.fixture(scope="session")
+def mock_api_url():
+    """
+    Base URL of a mock API server started for the session
+
+    The server runs in its own process on a free port, so every xdist worker
+    gets an independent instance without importing the Flask app itself.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+    # Server errors go to a file: an unread pipe would fill up and block the server
+    server_log = tempfile.TemporaryFile()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "flask",
+            "--app",
+            "src.api.mock_api_server:app",
+            "run",
+            "--port",
+            str(port),
+        ],
+        cwd=project_root,
+        stdout=subprocess.DEVNULL,
+        stderr=server_log,
+    )
+    url = f"http://127.0.0.1:{port}"
+
+    # Wait for the health endpoint before handing out the URL, giving up early
+    # if the server exits, e.g. on an import error
+    deadline = time.time() + 10
+    while time.time() < deadline and process.poll() is None:
+        try:
+            if requests.get(f"{url}/health", timeout=1).status_code == 200:
+                break
+        except requests.RequestException:
+            pass
+        time.sleep(0.1)
+    else:
+        process.terminate()
+        process.wait(timeout=10)
+        server_log.seek(0)
+        output = server_log.read().decode(errors="replace").strip()[-2000:]
+        server_log.close()
+        pytest.skip(
+            f"Mock API server did not start (exit code {process.returncode}): "
+            f"{output or 'no output'}"
+        )
+
+    logger.info(f"✅ Mock API server running at {url}")
+    yield url
+
+    process.terminate()
+    process.wait(timeout=10)
+    server_log.close()
 
 
 # Pytest markers registration
 def pytest_configure(config):
     """Register custom pytest markers"""
+    # Gate log emission on LOG_LEVEL so CI can run quieter (e.g. WARNING)
+    logger.remove()
+    logger.add(sys.stderr, level=settings.log_level.upper())
+
     markers = [
         "ui: marks tests as UI tests",
         "api: marks tests as API tests",
@@ -217,11 +670,28 @@ def pytest_configure(config):
         "visual: marks tests as visual tests",
         "ai: marks tests as AI-powered tests",
         "slow: marks tests as slow running tests",
+        "navigates: marks tests that leave the page they started on",
     ]
 
     for marker in markers:
         config.addinivalue_line("markers", marker)
 
+    # Launch the shared Chrome once, from the controller process only
+    global _shared_chrome_process
+    if config.getoption("--shared-chrome") and not hasattr(config, "workerinput"):
+        _shared_chrome_process = _launch_shared_chrome(
+            config.getoption("--headless"),
+            _resolve_host_resolver_rules(config.getoption("--url")),
+        )
+
+
+def pytest_unconfigure(config):
+    """Stop the shared Chrome process"""
+    if _shared_chrome_process:
+        _shared_chrome_process.terminate()
+        _shared_chrome_process.wait(timeout=10)
+        logger.info("✅ Shared Chrome closed")
+
 
 # Test result hooks
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -0,0 +1,25 @@
+"""
+Shared locators and waits for the basic test suites
+"""
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Common locators
+BODY = (By.CSS_SELECTOR, "body")
+FEATURES = (By.CSS_SELECTOR, ".features_items")
+SINGLE_PRODUCTS = (By.CSS_SELECTOR, ".single-products")
+SEARCH_INPUT = (By.CSS_SELECTOR, "#search_product")
+SEARCH_BUTTON = (By.CSS_SELECTOR, "#submit_search")
+NAV_MENU = (By.CSS_SELECTOR, ".navbar-nav")
+PRODUCTS_LINK = (By.CSS_SELECTOR, "a[href='/products']")
+HOME_LINK = (By.CSS_SELECTOR, "a[href='/']")
+LOGO_LINK = (By.CSS_SELECTOR, ".logo a")
+SIGNUP_FORM = (By.CSS_SELECTOR, ".signup-form")
+LOGIN_FORM = (By.CSS_SELECTOR, ".login-form")
+
+
+def wait_for(driver, locator, timeout=10):
+    """Wait for element located by locator to be present"""
+    return WebDriverWait(driver, timeout).until(EC.presence_of_element_located(locator))
@@ -5,13 +5,16 @@ This module contains performance tests that verify the application meets
 performance requirements under various conditions.
 """
 
+import asyncio
 import time
 
 import pytest
 import requests
+from loguru import logger
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+
+from src.ui.ui_helpers import UIHelpers
+from tests.helpers import BODY, FEATURES, SINGLE_PRODUCTS, wait_for
 
 
 class TestPerformanceBasic:
@@ -20,79 +23,68 @@ class TestPerformanceBasic:
     def test_page_load_performance(self, driver):
         """Performance test: Page should load within acceptable time."""
         # Test home page load performance
-        start_time = time.time()
         driver.get("https://automationexercise.com/")
 
         # Wait for page to be fully loaded
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".features_items"))
-        )
+        wait_for(driver, FEATURES, 20)
 
-        load_time = time.time() - start_time
+        # Load time as reported by the browser's Navigation Timing API
+        load_time_ms = UIHelpers(driver).get_page_load_time(timeout=20)
 
         # Page should load within 15 seconds
         assert (
-            load_time < 15
-        ), f"Home page load took {load_time:.2f} seconds, should be under 15 seconds"
+            load_time_ms < 15000
+        ), f"Home page load took {load_time_ms}ms, should be under 15000ms"
 
     def test_products_page_performance(self, driver):
         """Performance test: Products page should load within acceptable time."""
         # Test products page load performance
-        start_time = time.time()
         driver.get("https://automationexercise.com/products")
 
         # Wait for products to load
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".single-products"))
-        )
+        wait_for(driver, SINGLE_PRODUCTS, 20)
 
-        load_time = time.time() - start_time
+        # Load time as reported by the browser's Navigation Timing API
+        load_time_ms = UIHelpers(driver).get_page_load_time(timeout=20)
 
         # Page should load within 15 seconds
         assert (
-            load_time < 15
-        ), f"Products page load took {load_time:.2f} seconds, should be under 15 seconds"
+            load_time_ms < 15000
+        ), f"Products page load took {load_time_ms}ms, should be under 15000ms"
 
-    def test_search_performance(self, driver):
+    def test_search_performance(self):
         """Performance test: Search functionality should be responsive."""
-        # Navigate to products page
-        driver.get("https://automationexercise.com/products")
-
-        # Wait for search input
-        search_input = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "#search_product"))
-        )
-
-        # Test search performance
+        # The search form issues a plain GET to /products?search=<term>, so the
+        # endpoint is probed over HTTP; the full UI flow is covered by
+        # test_search_functionality_smoke
         search_terms = ["dress", "top", "shirt"]
 
-        for term in search_terms:
-            # Clear and enter search term
-            search_input.clear()
-            search_input.send_keys(term)
+        with requests.Session() as session:
+            for term in search_terms:
+                try:
+                    # Measure search response time
+                    start_time = time.time()
+                    response = session.get(
+                        "https://automationexercise.com/products",
+                        params={"search": term},
+                        timeout=10,
+                    )
+                    search_time = time.time() - start_time
+                except requests.RequestException as e:
+                    pytest.skip(f"Search for '{term}' not accessible: {e}")
 
-            # Measure search response time
-            start_time = time.time()
-            search_button = driver.find_element(By.CSS_SELECTOR, "#submit_search")
-            search_button.click()
-
-            # Wait for results
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".features_items"))
-            )
+                assert (
+                    response.status_code == 200
+                ), f"Search for '{term}' should return 200 status"
 
-            search_time = time.time() - start_time
+                # Search should return product results
+                results = response.text.count('class="single-products"')
+                assert results > 0, f"Search for '{term}' returned no products"
 
-            # Search should complete within 10 seconds
-            assert (
-                search_time < 10
-            ), f"Search for '{term}' took {search_time:.2f} seconds, should be under 10 seconds"
-
-            # Navigate back to products page for next search
-            driver.get("https://automationexercise.com/products")
-            search_input = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "#search_product"))
-            )
+                # Search should complete within 10 seconds
+                assert (
+                    search_time < 10
+                ), f"Search for '{term}' took {search_time:.2f} seconds, should be under 10 seconds"
 
     def test_navigation_performance(self, driver):
         """Performance test: Navigation between pages should be fast."""
@@ -103,23 +95,33 @@ class TestPerformanceBasic:
             "https://automationexercise.com/login",
             "https://automationexercise.com/view_cart",
         ]
+        ui_helpers = UIHelpers(driver)
 
-        for page_url in pages:
-            # Measure navigation time
-            start_time = time.time()
+        # Warm up the session on the first page; subsequent same-origin
+        # navigations reuse its connections and HTTP cache
+        driver.get(pages[0])
+        wait_for(driver, BODY, 15)
+
+        for page_url in pages[1:]:
             driver.get(page_url)
 
             # Wait for page to load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-            )
+            wait_for(driver, BODY, 15)
 
-            navigation_time = time.time() - start_time
+            # Measure incremental navigation time on the warm session
+            navigation_time_ms = ui_helpers.get_page_load_time(timeout=15)
+
+            # Resources served from cache report a zero transfer size
+            cached_resources = driver.execute_script(
+                "return performance.getEntriesByType('resource')"
+                ".filter(entry => entry.transferSize === 0).length"
+            )
+            logger.info(f"{page_url}: {cached_resources} resources served from cache")
 
             # Navigation should complete within 15 seconds
             assert (
-                navigation_time < 15
-            ), f"Navigation to {page_url} took {navigation_time:.2f} seconds, should be under 15 seconds"
+                navigation_time_ms < 15000
+            ), f"Navigation to {page_url} took {navigation_time_ms}ms, should be under 15000ms"
 
     def test_api_performance(self):
         """Performance test: API endpoints should respond quickly."""
@@ -129,23 +131,26 @@ class TestPerformanceBasic:
             "https://automationexercise.com/api/brandsList",
         ]
 
-        for endpoint in api_endpoints:
-            try:
-                # Measure API response time
-                start_time = time.time()
-                response = requests.get(endpoint, timeout=10)
-                api_time = time.time() - start_time
-
-                # API should respond within 15 seconds
-                assert (
-                    api_time < 15
-                ), f"API {endpoint} took {api_time:.2f} seconds, should be under 15 seconds"
-                assert (
-                    response.status_code == 200
-                ), f"API {endpoint} should return 200 status"
-
-            except requests.RequestException as e:
-                pytest.skip(f"API {endpoint} not accessible: {e}")
+        # One session resolves the host once and keeps the connection alive
+        # across endpoints
+        with requests.Session() as session:
+            for endpoint in api_endpoints:
+                try:
+                    # Measure API response time
+                    start_time = time.time()
+                    response = session.get(endpoint, timeout=10)
+                    api_time = time.time() - start_time
+
+                    # API should respond within 15 seconds
+                    assert (
+                        api_time < 15
+                    ), f"API {endpoint} took {api_time:.2f} seconds, should be under 15 seconds"
+                    assert (
+                        response.status_code == 200
+                    ), f"API {endpoint} should return 200 status"
+
+                except requests.RequestException as e:
+                    pytest.skip(f"API {endpoint} not accessible: {e}")
 
     def test_responsive_performance(self, driver):
         """Performance test: Responsive design should perform well on all devices."""
@@ -166,9 +171,7 @@ class TestPerformanceBasic:
             start_time = time.time()
             driver.get("https://automationexercise.com/")
 
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".features_items"))
-            )
+            wait_for(driver, FEATURES, 15)
 
             load_time = time.time() - start_time
 
@@ -183,9 +186,7 @@ class TestPerformanceBasic:
         driver.get("https://automationexercise.com/products")
 
         # Wait for page to load
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".single-products"))
-        )
+        wait_for(driver, SINGLE_PRODUCTS, 15)
 
         # Check image loading performance
         images = driver.find_elements(By.TAG_NAME, "img")
@@ -218,9 +219,7 @@ class TestPerformanceBasic:
             driver.get(page_url)
 
             # Wait for page to load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-            )
+            wait_for(driver, BODY, 15)
 
             # Verify page loads correctly
             assert "Automation Exercise" in driver.title
@@ -242,9 +241,7 @@ class TestPerformanceBasic:
             driver.get(page_url)
 
             # Wait for page to load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-            )
+            wait_for(driver, BODY, 15)
 
             # Verify page loads correctly
             assert "Automation Exercise" in driver.title
@@ -254,34 +251,45 @@ class TestPerformanceBasic:
                 time.sleep(0.5)
 
     @pytest.mark.slow
-    def test_stress_performance(self, driver):
-        """Performance test: Application should handle stress conditions."""
-        # Test application under stress (multiple rapid operations)
-        for i in range(5):
-            # Navigate to home page
-            driver.get("https://automationexercise.com/")
-
-            # Wait for page to load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".features_items"))
-            )
-
-            # Verify page loads correctly
-            assert "Automation Exercise" in driver.title
+    @pytest.mark.asyncio
+    async def test_stress_performance(self, headless_mode):
+        """Performance test: Application should handle concurrent users."""
+        from playwright.async_api import async_playwright
+
+        async def virtual_user(browser, user_id):
+            # Each virtual user gets an isolated browser context
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
 
-            # Navigate to products page
-            driver.get("https://automationexercise.com/products")
+                # Navigate to home page
+                await page.goto("https://automationexercise.com/")
+                await page.wait_for_selector(".features_items", timeout=15000)
 
-            # Wait for products to load
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".single-products"))
-            )
+                # Verify page loads correctly
+                title = await page.title()
+                assert (
+                    "Automation Exercise" in title
+                ), f"User {user_id}: unexpected home page title {title}"
 
-            # Verify products page loads
-            assert "products" in driver.current_url
+                # Navigate to products page
+                await page.goto("https://automationexercise.com/products")
+                await page.wait_for_selector(".single-products", timeout=15000)
 
-            # Brief pause between iterations
-            time.sleep(1)
+                # Verify products page loads
+                assert (
+                    "products" in page.url
+                ), f"User {user_id}: unexpected products page URL {page.url}"
+            finally:
+                await context.close()
+
+        # Test application under stress (concurrent virtual users)
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=headless_mode)
+            try:
+                await asyncio.gather(*(virtual_user(browser, i) for i in range(5)))
+            finally:
+                await browser.close()
 
     def test_network_performance(self, driver):
         """Performance test: Network requests should be optimized."""
@@ -289,9 +297,7 @@ class TestPerformanceBasic:
         driver.get("https://automationexercise.com/")
 
         # Wait for page to load
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".features_items"))
-        )
+        wait_for(driver, FEATURES, 15)
 
         # Check that all essential resources are loaded
         essential_elements = [
@@ -12,6 +12,20 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from src.ui.ui_helpers import UIHelpers
+from tests.helpers import (
+    BODY,
+    FEATURES,
+    HOME_LINK,
+    LOGO_LINK,
+    NAV_MENU,
+    PRODUCTS_LINK,
+    SEARCH_BUTTON,
+    SEARCH_INPUT,
+    SINGLE_PRODUCTS,
+    wait_for,
+)
+
 
 class TestRegressionBasic:
     """Basic regression tests to ensure core functionality remains intact."""
@@ -22,19 +36,17 @@ class TestRegressionBasic:
         driver.get("https://automationexercise.com/")
 
         # Wait for page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-        )
+        wait_for(driver, BODY, 10)
 
         # Check that page title is correct
         assert "Automation Exercise" in driver.title
 
         # Check that logo is present
-        logo = driver.find_element(By.CSS_SELECTOR, ".logo a")
+        logo = driver.find_element(*LOGO_LINK)
         assert logo.is_displayed()
 
         # Check that navigation menu is present
-        nav_menu = driver.find_element(By.CSS_SELECTOR, ".navbar-nav")
+        nav_menu = driver.find_element(*NAV_MENU)
         assert nav_menu.is_displayed()
 
     def test_search_functionality_regression(self, driver):
@@ -43,25 +55,21 @@ class TestRegressionBasic:
         driver.get("https://automationexercise.com/products")
 
         # Wait for search input to be present
-        search_input = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "#search_product"))
-        )
+        search_input = wait_for(driver, SEARCH_INPUT, 10)
 
         # Enter search term
         search_input.clear()
         search_input.send_keys("top")
 
         # Click search button
-        search_button = driver.find_element(By.CSS_SELECTOR, "#submit_search")
+        search_button = driver.find_element(*SEARCH_BUTTON)
         search_button.click()
 
         # Wait for search results
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".features_items"))
-        )
+        wait_for(driver, FEATURES, 10)
 
         # Check that search results are displayed
-        products = driver.find_elements(By.CSS_SELECTOR, ".single-products")
+        products = driver.find_elements(*SINGLE_PRODUCTS)
         assert len(products) > 0
 
     def test_navigation_regression(self, driver):
@@ -71,7 +79,7 @@ class TestRegressionBasic:
 
         # Navigate to products page
         products_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "a[href='/products']"))
+            EC.element_to_be_clickable(PRODUCTS_LINK)
         )
         products_link.click()
 
@@ -80,7 +88,7 @@ class TestRegressionBasic:
         assert "products" in driver.current_url
 
         # Navigate back to home
-        home_link = driver.find_element(By.CSS_SELECTOR, "a[href='/']")
+        home_link = driver.find_element(*HOME_LINK)
         home_link.click()
 
         # Verify we're back on home page
@@ -101,9 +109,7 @@ class TestRegressionBasic:
         ]
 
         for selector in essential_elements:
-            element = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-            )
+            element = wait_for(driver, (By.CSS_SELECTOR, selector), 10)
             assert element.is_displayed(), f"Element {selector} should be visible"
 
     def test_responsive_design_regression(self, driver):
@@ -125,35 +131,31 @@ class TestRegressionBasic:
             driver.get("https://automationexercise.com/")
 
             # Check that page loads without errors
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-            )
+            wait_for(driver, BODY, 10)
 
             # Verify page is accessible
             assert "Automation Exercise" in driver.title
 
             # Check that navigation is still functional
-            nav_menu = driver.find_element(By.CSS_SELECTOR, ".navbar-nav")
+            nav_menu = driver.find_element(*NAV_MENU)
             assert nav_menu.is_displayed()
 
     @pytest.mark.slow
     def test_performance_regression(self, driver):
         """Regression test: Page load performance should remain acceptable."""
-        # Navigate to home page and measure load time
-        start_time = time.time()
+        # Navigate to home page
         driver.get("https://automationexercise.com/")
 
         # Wait for page to be fully loaded
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".features_items"))
-        )
+        wait_for(driver, FEATURES, 20)
 
-        load_time = time.time() - start_time
+        # Load time as reported by the browser's Navigation Timing API
+        load_time_ms = UIHelpers(driver).get_page_load_time(timeout=20)
 
         # Performance should be under 15 seconds (accounting for network delays)
         assert (
-            load_time < 15
-        ), f"Page load took {load_time:.2f} seconds, should be under 15 seconds"
+            load_time_ms < 15000
+        ), f"Page load took {load_time_ms}ms, should be under 15000ms"
 
         # Check that all images are loaded
         images = driver.find_elements(By.TAG_NAME, "img")
@@ -7,10 +7,24 @@ is working before running more comprehensive test suites.
 
 import time
 
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from tests.helpers import (
+    BODY,
+    FEATURES,
+    HOME_LINK,
+    LOGIN_FORM,
+    LOGO_LINK,
+    NAV_MENU,
+    PRODUCTS_LINK,
+    SEARCH_BUTTON,
+    SEARCH_INPUT,
+    SIGNUP_FORM,
+    SINGLE_PRODUCTS,
+    wait_for,
+)
+
 
 class TestSmokeBasic:
     """Basic smoke tests to verify critical functionality is working."""
@@ -21,19 +35,17 @@ class TestSmokeBasic:
         driver.get("https://automationexercise.com/")
 
         # Wait for page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-        )
+        wait_for(driver, BODY, 10)
 
         # Critical checks
         assert "Automation Exercise" in driver.title, "Page title should be correct"
 
         # Check that logo is present
-        logo = driver.find_element(By.CSS_SELECTOR, ".logo a")
+        logo = driver.find_element(*LOGO_LINK)
         assert logo.is_displayed(), "Logo should be visible"
 
         # Check that navigation menu is present
-        nav_menu = driver.find_element(By.CSS_SELECTOR, ".navbar-nav")
+        nav_menu = driver.find_element(*NAV_MENU)
         assert nav_menu.is_displayed(), "Navigation menu should be visible"
 
     def test_products_page_smoke(self, driver):
@@ -42,21 +54,19 @@ class TestSmokeBasic:
         driver.get("https://automationexercise.com/products")
 
         # Wait for page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-        )
+        wait_for(driver, BODY, 10)
 
         # Critical checks
         assert "products" in driver.current_url, "Should be on products page"
 
         # Check that products are displayed
         products = WebDriverWait(driver, 10).until(
-            EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".single-products"))
+            EC.presence_of_all_elements_located(SINGLE_PRODUCTS)
         )
         assert len(products) > 0, "Products should be displayed"
 
         # Check that search functionality is available
-        search_input = driver.find_element(By.CSS_SELECTOR, "#search_product")
+        search_input = driver.find_element(*SEARCH_INPUT)
         assert search_input.is_displayed(), "Search input should be visible"
 
     def test_navigation_smoke(self, driver):
@@ -66,7 +76,7 @@ class TestSmokeBasic:
 
         # Navigate to products page
         products_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "a[href='/products']"))
+            EC.element_to_be_clickable(PRODUCTS_LINK)
         )
         products_link.click()
 
@@ -75,7 +85,7 @@ class TestSmokeBasic:
         assert "products" in driver.current_url, "Should navigate to products page"
 
         # Navigate back to home
-        home_link = driver.find_element(By.CSS_SELECTOR, "a[href='/']")
+        home_link = driver.find_element(*HOME_LINK)
         home_link.click()
 
         # Verify we're back on home page
@@ -90,24 +100,20 @@ class TestSmokeBasic:
         driver.get("https://automationexercise.com/products")
 
         # Wait for search input
-        search_input = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "#search_product"))
-        )
+        search_input = wait_for(driver, SEARCH_INPUT, 10)
 
         # Perform search
         search_input.clear()
         search_input.send_keys("top")
 
-        search_button = driver.find_element(By.CSS_SELECTOR, "#submit_search")
+        search_button = driver.find_element(*SEARCH_BUTTON)
         search_button.click()
 
         # Verify search results page loads
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".features_items"))
-        )
+        wait_for(driver, FEATURES, 10)
 
         # Check that search results are displayed
-        products = driver.find_elements(By.CSS_SELECTOR, ".single-products")
+        products = driver.find_elements(*SINGLE_PRODUCTS)
         assert len(products) > 0, "Search should return results"
 
     def test_login_page_smoke(self, driver):
@@ -116,19 +122,17 @@ class TestSmokeBasic:
         driver.get("https://automationexercise.com/login")
 
         # Wait for page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-        )
+        wait_for(driver, BODY, 10)
 
         # Critical checks
         assert "login" in driver.current_url, "Should be on login page"
 
         # Check that login form is present
-        login_form = driver.find_element(By.CSS_SELECTOR, ".login-form")
+        login_form = driver.find_element(*LOGIN_FORM)
         assert login_form.is_displayed(), "Login form should be visible"
 
         # Check that signup form is present
-        signup_form = driver.find_element(By.CSS_SELECTOR, ".signup-form")
+        signup_form = driver.find_element(*SIGNUP_FORM)
         assert signup_form.is_displayed(), "Signup form should be visible"
 
     def test_cart_page_smoke(self, driver):
@@ -137,9 +141,7 @@ class TestSmokeBasic:
         driver.get("https://automationexercise.com/view_cart")
 
         # Wait for page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-        )
+        wait_for(driver, BODY, 10)
 
         # Critical checks
         assert "cart" in driver.current_url, "Should be on cart page"
@@ -153,18 +155,14 @@ class TestSmokeBasic:
         driver.set_window_size(1920, 1080)
         driver.get("https://automationexercise.com/")
 
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-        )
+        wait_for(driver, BODY, 10)
         assert "Automation Exercise" in driver.title, "Desktop view should work"
 
         # Test mobile size
         driver.set_window_size(375, 667)
         driver.get("https://automationexercise.com/")
 
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-        )
+        wait_for(driver, BODY, 10)
         assert "Automation Exercise" in driver.title, "Mobile view should work"
 
     def test_performance_smoke(self, driver):
@@ -174,9 +172,7 @@ class TestSmokeBasic:
         driver.get("https://automationexercise.com/")
 
         # Wait for page to be fully loaded
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".features_items"))
-        )
+        wait_for(driver, FEATURES, 15)
 
         load_time = time.time() - start_time
 
@@ -197,9 +193,7 @@ class TestSmokeBasic:
         driver.get("https://automationexercise.com/")
 
         # Should load correctly after error
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "body"))
-        )
+        wait_for(driver, BODY, 10)
         assert (
             "Automation Exercise" in driver.title
         ), "Should recover from error gracefully"
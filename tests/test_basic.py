@@ -4,14 +4,16 @@ These tests ensure the basic functionality works.
 """
 
 import os
-import sys
 from pathlib import Path
 
 import pytest
+import requests
 
-# Add project root to path
+# Project root; pytest.ini puts it on sys.path via pythonpath
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+
+# Files expected in the project root
+CONFIG_FILES = ("requirements.txt", ".gitignore", "README.md")
 
 
 class TestBasicFunctionality:
@@ -19,16 +21,19 @@ class TestBasicFunctionality:
 
     def test_project_structure(self):
         """Test that the project has the expected structure."""
-        assert (project_root / "tests").exists()
+        # List each directory once instead of stat-ing every expected path
+        with os.scandir(project_root) as entries:
+            top_level = {entry.name for entry in entries if entry.is_dir()}
+        assert {"tests", "src", "config"} <= top_level
+
+        with os.scandir(project_root / "src") as entries:
+            src_dirs = {entry.name for entry in entries if entry.is_dir()}
         # Check for 'src/utils' instead of 'utils' in the root
-        assert os.path.isdir(
-            os.path.join(project_root, "src", "utils")
-        ), "src/utils folder not found."
+        assert "utils" in src_dirs, "src/utils folder not found."
         # Check for 'src/ui/pages' instead of 'pages' in the root
-        assert os.path.isdir(
-            os.path.join(project_root, "src", "ui", "pages")
+        assert "ui" in src_dirs and os.path.isdir(
+            project_root / "src" / "ui" / "pages"
         ), "src/ui/pages folder not found."
-        assert (project_root / "config").exists()
 
     def test_imports(self):
         """Test that basic modules can be imported."""
@@ -41,9 +46,7 @@ class TestBasicFunctionality:
 
     def test_config_files(self):
         """Test that configuration files exist."""
-        config_files = ["requirements.txt", ".gitignore", "README.md"]
-
-        for config_file in config_files:
+        for config_file in CONFIG_FILES:
             assert (project_root / config_file).exists(), f"Missing {config_file}"
         # Check for 'requirements.txt' in the root
         assert os.path.isfile(
@@ -75,21 +78,13 @@ class TestMockAPI:
         except ImportError as e:
             pytest.skip(f"Mock API not available: {e}")
 
-    def test_mock_api_routes(self):
-        """Test that mock API has expected routes."""
-        try:
-            from mock_api_server import app
-
-            # Check that the app has routes
-            routes = [rule.rule for rule in app.url_map.iter_rules()]
-            assert len(routes) > 0
+    def test_mock_api_routes(self, mock_api_url):
+        """Test that mock API serves its expected routes."""
+        response = requests.get(f"{mock_api_url}/health", timeout=5)
+        assert response.status_code == 200
 
-            # Check for specific routes
-            route_names = [rule.endpoint for rule in app.url_map.iter_rules()]
-            assert "health_check" in route_names or "/health" in routes
-
-        except ImportError:
-            pytest.skip("Mock API not available")
+        response = requests.get(f"{mock_api_url}/api/version", timeout=5)
+        assert response.status_code == 200
 
 
 class TestAIDataGenerator:
@@ -107,24 +102,16 @@ class TestAIDataGenerator:
         except ImportError as e:
             pytest.skip(f"AI Data Generator not available: {e}")
 
-    def test_faker_fallback(self):
+    def test_faker_fallback(self, ai_user):
         """Test that Faker fallback works."""
-        try:
-            from src.core.utils.ai_data_generator import AIDataGenerator
-
-            generator = AIDataGenerator()
-
-            # Test generating data without AI (should use Faker)
-            user_data = generator.generate_user_profile()
-            assert isinstance(user_data, dict)
-            assert "first_name" in user_data
-            assert "email" in user_data
-            assert isinstance(user_data["first_name"], str)
-            assert len(user_data["first_name"]) > 0
-            assert "@" in user_data["email"]
-
-        except ImportError as e:
-            pytest.skip(f"AI Data Generator not available: {e}")
+        # Profile generated without AI (should use Faker)
+        user_data = ai_user
+        assert isinstance(user_data, dict)
+        assert "first_name" in user_data
+        assert "email" in user_data
+        assert isinstance(user_data["first_name"], str)
+        assert len(user_data["first_name"]) > 0
+        assert "@" in user_data["email"]
 
 
 class TestPageObjects:
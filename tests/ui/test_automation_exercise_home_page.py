@@ -3,25 +3,58 @@ UI Tests for Automation Exercise Home Page
 Tests for https://automationexercise.com/
 """
 
-import time
-
 import pytest
 from loguru import logger
 
-from src.core.utils.ai_data_generator import AIDataGenerator
 from src.ui.pages.automation_exercise_home_page import AutomationExerciseHomePage
 from tests.base_test_classes import BaseHomePageTest
 
+# Viewports covered by test_responsive_design
+VIEWPORTS = (
+    ((1920, 1080), "Desktop"),
+    ((768, 1024), "Tablet"),
+    ((375, 667), "Mobile"),
+)
+
 
 class TestAutomationExerciseHomePage(BaseHomePageTest):
     """Test class for Automation Exercise Home Page"""
 
+    # Header links followed in order by test_navigation_links
+    NAV_LINKS = (
+        ("Products", AutomationExerciseHomePage.PRODUCTS_LINK, "products"),
+        ("Cart", AutomationExerciseHomePage.CART_LINK, "cart"),
+        ("Signup/Login", AutomationExerciseHomePage.SIGNUP_LOGIN_LINK, "login"),
+    )
+
+    # Key elements that should be visible on the home page
+    VISIBLE_ELEMENTS = (
+        ("Header", AutomationExerciseHomePage.HEADER),
+        ("Logo", AutomationExerciseHomePage.LOGO),
+        ("Products Link", AutomationExerciseHomePage.PRODUCTS_LINK),
+        ("Cart Link", AutomationExerciseHomePage.CART_LINK),
+        ("Signup/Login Link", AutomationExerciseHomePage.SIGNUP_LOGIN_LINK),
+    )
+
+    @pytest.fixture(scope="class")
+    def home_page(self, driver):
+        """Home page object, opened once per class"""
+        home_page = AutomationExerciseHomePage(driver)
+        home_page.open_home_page()
+        return home_page
+
     @pytest.fixture(autouse=True)
-    def setup(self, driver):
+    def setup(self, request, driver, home_page, ai_generator):
         """Setup test environment"""
         self.driver = driver
-        self.home_page = AutomationExerciseHomePage(driver)
-        self.ai_generator = AIDataGenerator()
+        self.home_page = home_page
+        self.ai_generator = ai_generator
+
+        yield
+
+        # Return to the home page only after tests that navigated away
+        if request.node.get_closest_marker("navigates"):
+            self.home_page.open_home_page()
 
     def get_home_page(self):
         """Get home page object"""
@@ -37,90 +70,66 @@ class TestAutomationExerciseHomePage(BaseHomePageTest):
 
     # test_home_page_load is now inherited from BaseHomePageTest
 
+    @pytest.mark.navigates
     def test_search_functionality(self):
         """Test search functionality on the Products page"""
         logger.info("Testing search functionality on the Products page")
 
-        self.home_page.open_home_page()
         self.home_page.click_products()  # Navigate to the Products page
-        time.sleep(2)
+        self._wait_for_url_contains("products")
 
         # Test search for a product
         search_term = "Blue Top"
         self.home_page.search_product(search_term)
-        time.sleep(2)
+        self._wait_for_url_contains("search")
 
         # Verify search results page and product presence
         assert "search" in self.driver.current_url.lower(), "Search page not loaded"
-        assert (
-            search_term.lower() in self.driver.page_source.lower()
-        ), f"Product '{search_term}' not found in search results"
+        product_names = self.home_page.get_product_names()
+        assert any(
+            search_term.lower() in name.lower() for name in product_names
+        ), f"Product '{search_term}' not found in search results: {product_names}"
         logger.info(f"✅ Search functionality works for: {search_term}")
 
+    @pytest.mark.navigates
     def test_navigation_links(self):
         """Test navigation menu links"""
         logger.info("Testing navigation links")
 
-        self.home_page.open_home_page()
-
-        # Test Products link
-        self.home_page.click_products()
-        time.sleep(2)
-        assert "products" in self.driver.current_url.lower(), "Products page not loaded"
-        logger.info("✅ Products link works")
-
-        # Go back to home
-        self.driver.back()
-        time.sleep(1)
-
-        # Test Cart link
-        self.home_page.click_cart()
-        time.sleep(2)
-        assert "cart" in self.driver.current_url.lower(), "Cart page not loaded"
-        logger.info("✅ Cart link works")
-
-        # Go back to home
-        self.driver.back()
-        time.sleep(1)
-
-        # Test Signup/Login link
-        self.home_page.click_signup_login()
-        time.sleep(2)
-        assert "login" in self.driver.current_url.lower(), "Login page not loaded"
-        logger.info("✅ Signup/Login link works")
-
-    def test_test_cases_page(self):
-        """Test Test Cases page"""
-        logger.info("Testing Test Cases page")
-
-        self.home_page.open_home_page()
-        self.home_page.click_test_cases()
-        time.sleep(2)
+        # The menu is part of the shared header, so each link is followed from
+        # the page the previous one opened instead of going back home
+        for link_name, locator, url_fragment in self.NAV_LINKS:
+            self.home_page.click_element(locator)
+            self._wait_for_url_contains(url_fragment)
+            assert (
+                url_fragment in self.driver.current_url.lower()
+            ), f"{link_name} page not loaded"
+            logger.info(f"✅ {link_name} link works")
+
+    @pytest.mark.navigates
+    @pytest.mark.parametrize(
+        "page_name,click_method,url_fragment",
+        [
+            ("Test Cases", "click_test_cases", "test_cases"),
+            ("API Testing", "click_api_testing", "api_list"),
+        ],
+    )
+    def test_navigation_page(self, page_name, click_method, url_fragment):
+        """Test pages opened from the navigation menu"""
+        logger.info(f"Testing {page_name} page")
+
+        getattr(self.home_page, click_method)()
+        self._wait_for_url_contains(url_fragment)
 
         assert (
-            "test_cases" in self.driver.current_url.lower()
-        ), "Test Cases page not loaded"
-        logger.info("✅ Test Cases page works")
-
-    def test_api_testing_page(self):
-        """Test API Testing page"""
-        logger.info("Testing API Testing page")
-
-        self.home_page.open_home_page()
-        self.home_page.click_api_testing()
-        time.sleep(2)
-
-        assert (
-            "api_list" in self.driver.current_url.lower()
-        ), "API Testing page not loaded"
-        logger.info("✅ API Testing page works")
+            url_fragment in self.driver.current_url.lower()
+        ), f"{page_name} page not loaded"
+        logger.info(f"✅ {page_name} page works")
 
     def test_featured_products(self):
         """Test featured products display"""
         logger.info("Testing featured products")
 
-        self.home_page.open_home_page()
-
         # Get featured products
         products = self.home_page.get_featured_products()
 
@@ -128,54 +137,60 @@ class TestAutomationExerciseHomePage(BaseHomePageTest):
 
         # Log product details
         for i, product in enumerate(products[:3]):  # Show first 3 products
-            logger.info(f"   Product {i+1}: {product['name']} - {product['price']}")
+            logger.info(
+                "   Product {}: {} - {}", i + 1, product["name"], product["price"]
+            )
 
         logger.info(f"✅ Found {len(products)} featured products")
 
-    def test_ai_integration(self):
+    def test_ai_integration(self, ai_user, ai_product_catalog):
         """Test AI data integration with UI testing"""
         logger.info("Testing AI data integration")
 
-        self.home_page.open_home_page()
-
         # Generate AI data
-        user_data = self.ai_generator.generate_user_profile("customer")
-        products_data = self.ai_generator.generate_product_catalog("clothing", 3)
+        user_data = ai_user
+        products_data = ai_product_catalog("clothing", 3)
 
         # Get real products from page
         real_products = self.home_page.get_featured_products()
 
-        logger.info(f"🤖 AI User: {user_data['first_name']} {user_data['last_name']}")
-        logger.info(f"🤖 AI Products: {[p['name'] for p in products_data]}")
-        logger.info(f"🛍️ Real Products: {[p['name'] for p in real_products[:3]]}")
+        # Lazy arguments are only built when INFO is enabled
+        lazy_logger = logger.opt(lazy=True)
+        lazy_logger.info(
+            "🤖 AI User: {} {}",
+            lambda: user_data["first_name"],
+            lambda: user_data["last_name"],
+        )
+        lazy_logger.info(
+            "🤖 AI Products: {}", lambda: [p["name"] for p in products_data]
+        )
+        lazy_logger.info(
+            "🛍️ Real Products: {}", lambda: [p["name"] for p in real_products[:3]]
+        )
 
         assert len(real_products) > 0, "No real products found on page"
         assert len(products_data) > 0, "No AI products generated"
 
         logger.info("✅ AI integration test completed")
 
-    def test_responsive_design(self):
+    @pytest.mark.parametrize(
+        "window_size,device",
+        VIEWPORTS,
+        indirect=["window_size"],
+        ids=[device for _, device in VIEWPORTS],
+    )
+    def test_responsive_design(self, window_size, device):
         """Test responsive design on different screen sizes"""
-        logger.info("Testing responsive design")
-
-        viewports = [
-            (1920, 1080, "Desktop"),
-            (768, 1024, "Tablet"),
-            (375, 667, "Mobile"),
-        ]
+        width, height = window_size
+        logger.info(f"Testing responsive design on {device}")
 
-        for width, height, device in viewports:
-            self.driver.set_window_size(width, height)
-            time.sleep(1)
-
-            self.home_page.open_home_page()
-            time.sleep(2)
+        self.home_page.open_home_page()
 
-            # Check if page loads without errors
-            title = self.home_page.get_page_title()
-            assert "Automation Exercise" in title, f"Page not loaded on {device}"
+        # Check if page loads without errors
+        title = self.home_page.get_page_title()
+        assert "Automation Exercise" in title, f"Page not loaded on {device}"
 
-            logger.info(f"✅ {device} viewport ({width}x{height}) works")
+        logger.info(f"✅ {device} viewport ({width}x{height}) works")
 
     # test_page_performance is now inherited from BaseHomePageTest
 
@@ -183,71 +198,57 @@ class TestAutomationExerciseHomePage(BaseHomePageTest):
         """Test key page elements are visible"""
         logger.info("Testing page elements visibility")
 
-        self.home_page.open_home_page()
+        # Check all elements in a single browser round-trip
+        visibility = self.home_page.are_elements_visible(
+            [locator for _, locator in self.VISIBLE_ELEMENTS]
+        )
 
-        # Check key elements that should be visible on home page
-        elements_to_check = [
-            ("Header", self.home_page.HEADER),
-            ("Logo", self.home_page.LOGO),
-            ("Products Link", self.home_page.PRODUCTS_LINK),
-            ("Cart Link", self.home_page.CART_LINK),
-            ("Signup/Login Link", self.home_page.SIGNUP_LOGIN_LINK),
-        ]
-
-        for element_name, locator in elements_to_check:
-            try:
-                element = self.driver.find_element(*locator)
-                assert element.is_displayed(), f"{element_name} is not visible"
-                logger.info(f"✅ {element_name}: Visible")
-            except Exception as e:
-                logger.error(f"❌ {element_name}: Error - {e}")
-                raise
+        for (element_name, _), visible in zip(self.VISIBLE_ELEMENTS, visibility):
+            assert visible, f"{element_name} is not visible"
+            logger.info(f"✅ {element_name}: Visible")
 
         # Note: Search box is only available on products page, not home page
         logger.info("✅ Page elements visibility test completed")
 
     @pytest.mark.smoke
+    @pytest.mark.navigates
     def test_smoke_test(self):
         """Smoke test - basic functionality"""
         logger.info("Running smoke test")
 
         # Test basic page load
-        self.home_page.open_home_page()
         title = self.home_page.get_page_title()
         assert "Automation Exercise" in title
 
         # Test basic navigation
         self.home_page.click_products()
-        time.sleep(1)
+        self._wait_for_url_contains("products")
         assert "products" in self.driver.current_url.lower()
 
         logger.info("✅ Smoke test passed")
 
     @pytest.mark.ai
+    @pytest.mark.navigates
     def test_ai_powered_testing(self):
         """AI-powered test scenario"""
         logger.info("Running AI-powered test")
 
         # Generate dynamic test data
         # user_data = self.ai_generator.generate_user_profile("customer")  # Unused variable
-        search_terms = self.ai_generator.generate_search_terms(3)
-
-        self.home_page.open_home_page()
+        # Repeating a term would leave the URL unchanged, so search each once
+        search_terms = list(dict.fromkeys(self.ai_generator.generate_search_terms(3)))
 
         # Navigate to products page first (search box is on products page)
         self.home_page.click_products()
-        time.sleep(2)
+        self._wait_for_url_contains("products")
 
-        # Test search with AI-generated terms
+        # Test search with AI-generated terms; the results page keeps the
+        # search box, so each search starts from the previous results
         for term in search_terms:
+            previous_url = self.driver.current_url
             self.home_page.search_product(term)
-            time.sleep(2)
+            self._wait_for_url_change(previous_url)
             assert "search" in self.driver.current_url.lower()
-            self.driver.back()
-            time.sleep(1)
-            # Navigate back to products page for next search
-            self.home_page.click_products()
-            time.sleep(1)
 
         logger.info(
             f"✅ AI-powered test completed with {len(search_terms)} search terms"
@@ -257,15 +258,14 @@ class TestAutomationExerciseHomePage(BaseHomePageTest):
         """Test that the header and footer are present and visible on the home page."""
         logger.info("Testing header and footer visibility")
 
-        self.home_page.open_home_page()
-        time.sleep(1)
+        header_visible, footer_visible = self.home_page.are_elements_visible(
+            [self.home_page.HEADER, self.home_page.FOOTER]
+        )
 
         # Check header
-        header = self.driver.find_element(*self.home_page.HEADER)
-        assert header.is_displayed(), "Header is not visible"
+        assert header_visible, "Header is not visible"
         logger.info("✅ Header is visible")
 
         # Check footer
-        footer = self.driver.find_element(*self.home_page.FOOTER)
-        assert footer.is_displayed(), "Footer is not visible"
+        assert footer_visible, "Footer is not visible"
         logger.info("✅ Footer is visible")
@@ -3,59 +3,50 @@ UI tests for SmartShop home page
 Demonstrates AI tools integration in testing
 """
 
-import time
-
 import pytest
 from loguru import logger
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
-from src.core.utils.ai_data_generator import AIDataGenerator
-from src.core.utils.visual_testing import VisualTester
 from src.ui.pages.home_page import HomePage
+from src.ui.ui_helpers import UIHelpers
 
+# Modal or alert shown after a product is added to the cart
+CART_CONFIRMATION = (By.CSS_SELECTOR, ".modal-content, .alert-success")
 
-class TestHomePage:
-    """Home page UI tests with AI-powered data generation"""
+# Any visible success element or success text, matched inside the browser
+CART_SUCCESS_SCRIPT = """
+const visible = [...document.querySelectorAll(
+    ".modal-content, .alert-success, .success-message"
+)].some((el) => el.getClientRects().length > 0);
+return visible || /added|successfully/i.test(document.body.innerText);
+"""
 
-    @pytest.fixture(scope="class")
-    def driver(self):
-        """WebDriver fixture"""
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
 
-        # Setup Chrome options
-        chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument("--headless")  # Run in headless mode
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
+# Screen sizes covered by test_responsive_design: desktop, laptop, tablet, mobile
+SCREEN_SIZES = (
+    (1920, 1080),
+    (1366, 768),
+    (768, 1024),
+    (375, 667),
+)
+
 
-        # Initialize driver
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+def scrolled_to_top(driver):
+    """Expected condition: the page is scrolled to the very top"""
+    return driver.execute_script("return window.pageYOffset") == 0
 
-        yield driver
 
-        # Cleanup
-        driver.quit()
+class TestHomePage:
+    """Home page UI tests with AI-powered data generation"""
 
     @pytest.fixture(scope="class")
     def home_page(self, driver):
         """Home page object fixture"""
         return HomePage(driver)
 
-    @pytest.fixture(scope="class")
-    def ai_generator(self):
-        """AI data generator fixture"""
-        return AIDataGenerator()
-
-    @pytest.fixture(scope="class")
-    def visual_tester(self):
-        """Visual tester fixture"""
-        return VisualTester()
-
     @pytest.mark.ui
     @pytest.mark.smoke
     def test_home_page_loads_successfully(self, home_page):
@@ -76,13 +67,21 @@ class TestHomePage:
     @pytest.mark.smoke
     def test_page_elements_are_visible(self, home_page):
         """Test that main page elements are visible"""
-        home_page.open_home_page()
-
-        # Check main elements that are visible on home page
-        assert home_page.is_logo_visible(), "Logo is not visible"
-        assert home_page.is_home_link_visible(), "Home link is not visible"
-        assert home_page.is_navigation_menu_visible(), "Navigation menu is not visible"
-        assert home_page.is_footer_visible(), "Footer is not visible"
+        home_page.ensure_home_page()
+
+        # Check main elements that are visible on home page in one script call
+        logo, home_link, navigation_menu, footer = home_page.are_elements_visible(
+            [
+                home_page.LOGO,
+                home_page.HOME_LINK,
+                home_page.CATEGORY_MENU,
+                home_page.FOOTER,
+            ]
+        )
+        assert logo, "Logo is not visible"
+        assert home_link, "Home link is not visible"
+        assert navigation_menu, "Navigation menu is not visible"
+        assert footer, "Footer is not visible"
 
         # Note: Search bar is only available on products page, not home page
         logger.info("All main page elements are visible")
@@ -108,19 +107,19 @@ class TestHomePage:
         logger.info(f"Visual check passed: {visual_result['status']}")
 
     @pytest.mark.ui
-    def test_search_functionality(self, home_page, ai_generator):
+    def test_search_functionality(self, home_page, ai_product_catalog):
         """Test search functionality with AI-generated data"""
         home_page.open_home_page()
 
         # Generate search query using AI
-        products = ai_generator.generate_product_catalog("electronics", 1)
+        products = ai_product_catalog("electronics", 1)
         search_query = products[0]["name"] if products else "laptop"
 
         # Perform search
         home_page.search_product(search_query)
 
         # Check that search was performed (URL changed)
-        time.sleep(2)  # Wait for search to complete
+        WebDriverWait(home_page.driver, 10).until(EC.url_contains("search"))
         current_url = home_page.get_current_url()
 
         assert (
@@ -145,7 +144,7 @@ class TestHomePage:
             home_page.select_category(category)
 
             # Check that URL changed
-            time.sleep(2)
+            WebDriverWait(home_page.driver, 10).until(EC.url_changes(initial_url))
             new_url = home_page.get_current_url()
 
             assert (
@@ -167,44 +166,23 @@ class TestHomePage:
         home_page.add_product_to_cart(0)
 
         # Wait for cart update
-        time.sleep(2)
+        try:
+            WebDriverWait(home_page.driver, 5).until(
+                EC.visibility_of_element_located(CART_CONFIRMATION)
+            )
+        except TimeoutException:
+            logger.warning("No cart confirmation shown after adding product")
 
         # Check that product was added by looking for success message or modal
         # On Automation Exercise, there should be a modal or notification
         try:
-            # Look for common success messages
-            success_selectors = [
-                ".modal-content",  # Modal dialog
-                ".alert-success",  # Success alert
-                ".success-message",  # Success message
-                "text=Added",  # Text containing "Added"
-                "text=successfully",  # Text containing "successfully"
-            ]
-
-            success_found = False
-            for selector in success_selectors:
-                try:
-                    if selector.startswith("text="):
-                        # Search for text in page
-                        page_text = home_page.driver.page_source.lower()
-                        if selector[5:].lower() in page_text:
-                            success_found = True
-                            break
-                    else:
-                        # Search for element
-                        element = home_page.driver.find_element(
-                            By.CSS_SELECTOR, selector
-                        )
-                        if element.is_displayed():
-                            success_found = True
-                            break
-                except Exception:
-                    continue
+            # Look for common success messages in a single script call
+            success_found = home_page.driver.execute_script(CART_SUCCESS_SCRIPT)
 
             # If no success message found, check if we can navigate to cart
             if not success_found:
                 home_page.click_cart()
-                time.sleep(2)
+                WebDriverWait(home_page.driver, 10).until(EC.url_contains("cart"))
                 cart_url = home_page.get_current_url()
                 assert (
                     "cart" in cart_url.lower()
@@ -221,20 +199,24 @@ class TestHomePage:
         logger.info("Product added to cart successfully")
 
     @pytest.mark.ui
-    def test_newsletter_subscription(self, home_page, ai_generator):
+    def test_newsletter_subscription(self, home_page, unique_email):
         """Test newsletter subscription with AI-generated data"""
         home_page.open_home_page()
         home_page.scroll_to_footer()
 
-        # Generate email using AI
-        user_data = ai_generator.generate_user_profile("customer")
-        email = user_data["email"]
+        # Shared AI email with a per-test suffix, so each run subscribes anew
+        email = unique_email
 
         # Subscribe to newsletter
         home_page.subscribe_to_newsletter(email)
 
         # Check that subscription was performed (may be notification or form change)
-        time.sleep(2)
+        try:
+            WebDriverWait(home_page.driver, 5).until(
+                EC.visibility_of_element_located(home_page.NEWSLETTER_SUCCESS)
+            )
+        except TimeoutException:
+            logger.warning("No subscription confirmation shown")
 
         # Here you can add verification of successful subscription
         # For example, check for notification appearance or button state change
@@ -243,7 +225,7 @@ class TestHomePage:
 
     @pytest.mark.ui
     @pytest.mark.visual
-    def test_banner_visibility(self, home_page, visual_tester):
+    def test_banner_visibility(self, home_page, element_visibility):
         """Test banner visibility with AI analysis"""
         home_page.open_home_page()
 
@@ -251,7 +233,7 @@ class TestHomePage:
         assert home_page.is_banner_visible(), "Main banner is not visible"
 
         # Analyze banner with AI
-        banner_result = visual_tester.check_element_visibility(
+        banner_result = element_visibility(
             home_page.driver, home_page.MAIN_BANNER[1]  # CSS selector
         )
 
@@ -276,7 +258,9 @@ class TestHomePage:
 
         # Scroll to the very bottom of the page
         home_page.scroll_to_bottom()
-        time.sleep(2)
+        WebDriverWait(home_page.driver, 5).until(
+            EC.visibility_of_element_located(home_page.COPYRIGHT_TEXT)
+        )
 
         # Check that copyright text is visible and contains expected text
         assert home_page.is_copyright_visible(), "Copyright text is not visible"
@@ -295,7 +279,7 @@ class TestHomePage:
         if home_page.is_back_to_top_visible():
             # Click back to top button
             home_page.click_back_to_top()
-            time.sleep(2)
+            WebDriverWait(home_page.driver, 5).until(scrolled_to_top)
 
             # Verify we're back at the top (check if logo is visible)
             assert (
@@ -305,7 +289,7 @@ class TestHomePage:
         else:
             # If no back to top button, scroll back to top manually
             home_page.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            WebDriverWait(home_page.driver, 5).until(scrolled_to_top)
             assert (
                 home_page.is_logo_visible()
             ), "Not returned to top of page after manual scroll"
@@ -316,7 +300,7 @@ class TestHomePage:
     @pytest.mark.ui
     def test_footer_links(self, home_page):
         """Test footer visibility and copyright"""
-        home_page.open_home_page()
+        home_page.ensure_home_page()
         home_page.scroll_to_footer()
 
         # Check that footer is visible
@@ -341,50 +325,40 @@ class TestHomePage:
 
     @pytest.mark.ui
     @pytest.mark.regression
-    def test_responsive_design(self, home_page):
+    @pytest.mark.parametrize(
+        "window_size",
+        SCREEN_SIZES,
+        indirect=True,
+        ids=[f"{width}x{height}" for width, height in SCREEN_SIZES],
+    )
+    def test_responsive_design(self, home_page, window_size):
         """Test responsive design"""
-        home_page.open_home_page()
-
-        # Test different screen sizes
-        screen_sizes = [
-            (1920, 1080),  # Desktop
-            (1366, 768),  # Laptop
-            (768, 1024),  # Tablet
-            (375, 667),  # Mobile
-        ]
-
-        for width, height in screen_sizes:
-            home_page.set_window_size(width, height)
-            time.sleep(1)
+        width, height = window_size
+        home_page.ensure_home_page()
 
-            # Check that main elements are still visible
-            elements_status = home_page.verify_page_elements()
+        # The window_size fixture has already waited for the resize to apply
+        elements_status = home_page.verify_page_elements()
 
-            # Logo and main elements should be visible at all sizes
-            # Note: Search bar is not on home page, so we don't check it
-            assert elements_status["logo"], f"Logo not visible at size {width}x{height}"
-            assert elements_status[
-                "banner"
-            ], f"Banner not visible at size {width}x{height}"
-            assert elements_status[
-                "featured_products"
-            ], f"Featured products not visible at size {width}x{height}"
-            assert elements_status[
-                "footer"
-            ], f"Footer not visible at size {width}x{height}"
+        # Logo and main elements should be visible at all sizes
+        # Note: Search bar is not on home page, so we don't check it
+        assert elements_status["logo"], f"Logo not visible at size {width}x{height}"
+        assert elements_status["banner"], f"Banner not visible at size {width}x{height}"
+        assert elements_status[
+            "featured_products"
+        ], f"Featured products not visible at size {width}x{height}"
+        assert elements_status["footer"], f"Footer not visible at size {width}x{height}"
 
-            logger.info(f"Responsive design works at size {width}x{height}")
+        logger.info(f"Responsive design works at size {width}x{height}")
 
     @pytest.mark.ui
     @pytest.mark.performance
     def test_page_load_performance(self, home_page):
         """Test page load performance"""
-        import time
-
-        start_time = time.time()
         home_page.open_home_page()
-        home_page.wait_for_page_load()
-        load_time = time.time() - start_time
+
+        # Measured by the browser up to the load event, so it covers every
+        # subresource even though driver.get() returns at DOMContentLoaded
+        load_time = UIHelpers(home_page.driver).get_page_load_time() / 1000
 
         # Check that page loads within reasonable time
         assert load_time < 10.0, f"Page load time too slow: {load_time:.2f}s"
@@ -395,7 +369,7 @@ class TestHomePage:
     @pytest.mark.ai
     def test_ai_generated_test_scenarios(self, home_page, ai_generator):
         """Test AI-generated test scenarios"""
-        home_page.open_home_page()
+        home_page.ensure_home_page()
 
         # Generate test scenarios using AI
         scenarios = ai_generator.generate_test_scenarios("home page functionality")
@@ -417,7 +391,7 @@ class TestHomePage:
 
     @pytest.mark.ui
     @pytest.mark.visual
-    def test_element_visibility_analysis(self, home_page, visual_tester):
+    def test_element_visibility_analysis(self, home_page, element_visibility):
         """Test element visibility analysis with AI"""
         home_page.open_home_page()
 
@@ -430,7 +404,7 @@ class TestHomePage:
         ]
 
         for element_name, selector in elements_to_test:
-            result = visual_tester.check_element_visibility(home_page.driver, selector)
+            result = element_visibility(home_page.driver, selector)
 
             assert (
                 result["status"] == "passed"
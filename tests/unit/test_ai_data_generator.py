@@ -3,11 +3,109 @@ Unit tests for AI Data Generator
 Tests fallback logic and error handling
 """
 
-import os
+import json
 from unittest.mock import Mock, patch
 
+import pytest
+
 from src.core.utils.ai_data_generator import AIDataGenerator
 
+# Fields every generated user profile must contain
+REQUIRED_USER_FIELDS = frozenset(
+    {
+        "first_name",
+        "last_name",
+        "email",
+        "phone",
+        "address",
+        "city",
+        "country",
+        "postal_code",
+        "date_of_birth",
+        "preferences",
+        "loyalty_points",
+        "registration_date",
+    }
+)
+
+# Fields every generated product must contain
+REQUIRED_PRODUCT_FIELDS = frozenset(
+    {
+        "name",
+        "description",
+        "price",
+        "currency",
+        "category",
+        "brand",
+        "sku",
+        "stock_quantity",
+        "rating",
+        "features",
+        "images",
+    }
+)
+
+# Data returned by the mocked OpenAI client, serialized once as its responses
+USER_PROFILE = {
+    "first_name": "John",
+    "last_name": "Doe",
+    "email": "john.doe@example.com",
+    "phone": "+1234567890",
+    "address": "123 Main St",
+    "city": "New York",
+    "country": "USA",
+    "postal_code": "10001",
+    "date_of_birth": "1990-01-01",
+    "preferences": ["electronics", "books"],
+    "loyalty_points": 150,
+    "registration_date": "2023-01-01",
+}
+USER_JSON = json.dumps(USER_PROFILE)
+
+PRODUCTS = [
+    {
+        "name": "Smartphone X",
+        "description": "Latest smartphone model",
+        "price": 999.99,
+        "currency": "USD",
+        "category": "electronics",
+        "brand": "TechCorp",
+        "sku": "SMART-X-001",
+        "stock_quantity": 50,
+        "rating": 4.5,
+        "features": ["5G", "128GB", "Triple Camera"],
+        "images": ["https://example.com/phone1.jpg"],
+    }
+]
+PRODUCTS_JSON = json.dumps(PRODUCTS)
+
+SCENARIOS = [
+    {
+        "title": "Search for existing product",
+        "description": "Search for a product that exists in catalog",
+        "steps": ["Navigate to search page", "Enter product name", "Click search"],
+        "expected_result": "Product found and displayed",
+        "priority": "high",
+        "tags": ["search", "positive"],
+    }
+]
+SCENARIOS_JSON = json.dumps(SCENARIOS)
+
+
+def _mock_completion(content):
+    """Build a chat completion mock whose first choice returns content"""
+    return Mock(choices=[Mock(message=Mock(content=content))])
+
+
+@pytest.fixture
+def ai_with_mocked_openai(monkeypatch):
+    """Generator wired to a mocked OpenAI client, yielded with that client"""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+    with patch("openai.OpenAI") as mock_openai:
+        mock_client = Mock()
+        mock_openai.return_value = mock_client
+        yield AIDataGenerator(), mock_client
+
 
 class TestAIDataGenerator:
     """Unit tests for AIDataGenerator class"""
@@ -21,24 +119,20 @@ class TestAIDataGenerator:
             generator = AIDataGenerator()
             assert generator.openai_client is None
 
-    def test_init_with_invalid_openai_key(self):
+    def test_init_with_invalid_openai_key(self, monkeypatch):
         """Test initialization with invalid OpenAI API key"""
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "invalid-key"}):
-            # The generator will still create a client, but it will fail when used
-            generator = AIDataGenerator()
-            # The client is created but will fail on actual API calls
-            assert generator.openai_client is not None
+        monkeypatch.setenv("OPENAI_API_KEY", "invalid-key")
+
+        # The generator will still create a client, but it will fail when used
+        generator = AIDataGenerator()
+        # The client is created but will fail on actual API calls
+        assert generator.openai_client is not None
 
-    def test_init_with_valid_openai_key(self):
+    def test_init_with_valid_openai_key(self, ai_with_mocked_openai):
         """Test initialization with valid OpenAI API key"""
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test-valid-key"}):
-            with patch("openai.OpenAI") as mock_openai:
-                mock_client = Mock()
-                mock_openai.return_value = mock_client
+        generator, mock_client = ai_with_mocked_openai
 
-                generator = AIDataGenerator()
-                assert generator.openai_client is not None
-                mock_openai.assert_called_once()
+        assert generator.openai_client is mock_client
 
     def test_generate_user_profile_with_faker_fallback(self):
         """Test user profile generation with Faker fallback"""
@@ -48,138 +142,47 @@ class TestAIDataGenerator:
         user = generator.generate_user_profile("customer")
 
         # Check that user has all required fields
-        required_fields = [
-            "first_name",
-            "last_name",
-            "email",
-            "phone",
-            "address",
-            "city",
-            "country",
-            "postal_code",
-            "date_of_birth",
-            "preferences",
-            "loyalty_points",
-            "registration_date",
-        ]
-
-        for field in required_fields:
-            assert field in user, f"Missing field: {field}"
-            assert user[field] is not None, f"Field {field} is None"
-
-    def test_generate_user_profile_with_ai_success(self):
+        missing = REQUIRED_USER_FIELDS - user.keys()
+        assert not missing, f"Missing fields: {missing}"
+        empty = {field for field in REQUIRED_USER_FIELDS if user[field] is None}
+        assert not empty, f"Fields are None: {empty}"
+
+    def test_generate_user_profile_with_ai_success(self, ai_with_mocked_openai):
         """Test user profile generation with AI success"""
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[
-            0
-        ].message.content = """
-        {
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john.doe@example.com",
-            "phone": "+1234567890",
-            "address": "123 Main St",
-            "city": "New York",
-            "country": "USA",
-            "postal_code": "10001",
-            "date_of_birth": "1990-01-01",
-            "preferences": ["electronics", "books"],
-            "loyalty_points": 150,
-            "registration_date": "2023-01-01"
-        }
-        """
-
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test-key"}):
-            with patch("openai.OpenAI") as mock_openai:
-                mock_client = Mock()
-                mock_client.chat.completions.create.return_value = mock_response
-                mock_openai.return_value = mock_client
+        generator, mock_client = ai_with_mocked_openai
+        mock_client.chat.completions.create.return_value = _mock_completion(USER_JSON)
 
-                generator = AIDataGenerator()
-                user = generator.generate_user_profile("customer")
-
-                assert user["first_name"] == "John"
-                assert user["last_name"] == "Doe"
-                assert user["email"] == "john.doe@example.com"
-
-    def test_generate_user_profile_with_ai_403_error(self):
-        """Test user profile generation with AI 403 error (geographic restriction)"""
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[
-            0
-        ].message.content = """
-        {
-            "first_name": "John",
-            "last_name": "Doe",
-            "email": "john.doe@example.com",
-            "phone": "+1234567890",
-            "address": "123 Main St",
-            "city": "New York",
-            "country": "USA",
-            "postal_code": "10001",
-            "date_of_birth": "1990-01-01",
-            "preferences": ["electronics", "books"],
-            "loyalty_points": 150,
-            "registration_date": "2023-01-01"
-        }
-        """
-
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test-key"}):
-            with patch("openai.OpenAI") as mock_openai:
-                mock_client = Mock()
-                # Simulate 403 error
-                mock_client.chat.completions.create.side_effect = Exception(
-                    "Error code: 403 - {'error': {'code': 'unsupported_country_region_territory'}}"
-                )
-                mock_openai.return_value = mock_client
+        user = generator.generate_user_profile("customer")
 
-                generator = AIDataGenerator()
-                user = generator.generate_user_profile("customer")
-
-                # Should fallback to Faker
-                assert "first_name" in user
-                assert "last_name" in user
-                assert "email" in user
-
-    def test_generate_user_profile_with_ai_401_error(self):
-        """Test user profile generation with AI 401 error (invalid API key)"""
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-invalid-key"}):
-            with patch("openai.OpenAI") as mock_openai:
-                mock_client = Mock()
-                # Simulate 401 error
-                mock_client.chat.completions.create.side_effect = Exception(
-                    "Error code: 401 - {'error': {'code': 'invalid_api_key'}}"
-                )
-                mock_openai.return_value = mock_client
+        assert user["first_name"] == USER_PROFILE["first_name"]
+        assert user["last_name"] == USER_PROFILE["last_name"]
+        assert user["email"] == USER_PROFILE["email"]
 
-                generator = AIDataGenerator()
-                user = generator.generate_user_profile("customer")
-
-                # Should fallback to Faker
-                assert "first_name" in user
-                assert "last_name" in user
-                assert "email" in user
-
-    def test_generate_user_profile_with_ai_429_error(self):
-        """Test user profile generation with AI 429 error (rate limit)"""
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test-key"}):
-            with patch("openai.OpenAI") as mock_openai:
-                mock_client = Mock()
-                # Simulate 429 error
-                mock_client.chat.completions.create.side_effect = Exception(
-                    "Error code: 429 - Rate limit exceeded"
-                )
-                mock_openai.return_value = mock_client
+    @pytest.mark.parametrize(
+        "error_message",
+        [
+            # Geographic restriction
+            "Error code: 403 - {'error': {'code': 'unsupported_country_region_territory'}}",
+            # Invalid API key
+            "Error code: 401 - {'error': {'code': 'invalid_api_key'}}",
+            # Rate limit
+            "Error code: 429 - Rate limit exceeded",
+        ],
+        ids=["403", "401", "429"],
+    )
+    def test_generate_user_profile_with_ai_error(
+        self, ai_with_mocked_openai, error_message
+    ):
+        """Test user profile generation falls back to Faker on AI errors"""
+        generator, mock_client = ai_with_mocked_openai
+        mock_client.chat.completions.create.side_effect = Exception(error_message)
 
-                generator = AIDataGenerator()
-                user = generator.generate_user_profile("customer")
+        user = generator.generate_user_profile("customer")
 
-                # Should fallback to Faker
-                assert "first_name" in user
-                assert "last_name" in user
-                assert "email" in user
+        # Should fallback to Faker
+        assert "first_name" in user
+        assert "last_name" in user
+        assert "email" in user
 
     def test_generate_product_catalog_with_faker_fallback(self):
         """Test product catalog generation with Faker fallback"""
@@ -191,60 +194,25 @@ class TestAIDataGenerator:
         assert len(products) == 3
 
         for product in products:
-            required_fields = [
-                "name",
-                "description",
-                "price",
-                "currency",
-                "category",
-                "brand",
-                "sku",
-                "stock_quantity",
-                "rating",
-                "features",
-                "images",
-            ]
-
-            for field in required_fields:
-                assert field in product, f"Missing field: {field}"
-                assert product[field] is not None, f"Field {field} is None"
-
-    def test_generate_product_catalog_with_ai_success(self):
-        """Test product catalog generation with AI success"""
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[
-            0
-        ].message.content = """
-        [
-            {
-                "name": "Smartphone X",
-                "description": "Latest smartphone model",
-                "price": 999.99,
-                "currency": "USD",
-                "category": "electronics",
-                "brand": "TechCorp",
-                "sku": "SMART-X-001",
-                "stock_quantity": 50,
-                "rating": 4.5,
-                "features": ["5G", "128GB", "Triple Camera"],
-                "images": ["https://example.com/phone1.jpg"]
+            missing = REQUIRED_PRODUCT_FIELDS - product.keys()
+            assert not missing, f"Missing fields: {missing}"
+            empty = {
+                field for field in REQUIRED_PRODUCT_FIELDS if product[field] is None
             }
-        ]
-        """
+            assert not empty, f"Fields are None: {empty}"
 
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test-key"}):
-            with patch("openai.OpenAI") as mock_openai:
-                mock_client = Mock()
-                mock_client.chat.completions.create.return_value = mock_response
-                mock_openai.return_value = mock_client
+    def test_generate_product_catalog_with_ai_success(self, ai_with_mocked_openai):
+        """Test product catalog generation with AI success"""
+        generator, mock_client = ai_with_mocked_openai
+        mock_client.chat.completions.create.return_value = _mock_completion(
+            PRODUCTS_JSON
+        )
 
-                generator = AIDataGenerator()
-                products = generator.generate_product_catalog("electronics", 1)
+        products = generator.generate_product_catalog("electronics", 1)
 
-                assert len(products) == 1
-                assert products[0]["name"] == "Smartphone X"
-                assert products[0]["price"] == 999.99
+        assert len(products) == 1
+        assert products[0]["name"] == PRODUCTS[0]["name"]
+        assert products[0]["price"] == PRODUCTS[0]["price"]
 
     def test_generate_search_terms_with_faker_fallback(self):
         """Test search terms generation with Faker fallback"""
@@ -267,101 +235,71 @@ class TestAIDataGenerator:
         # Should return empty list when OpenAI is not available
         assert scenarios == []
 
-    def test_generate_test_scenarios_with_ai_success(self):
+    def test_generate_test_scenarios_with_ai_success(self, ai_with_mocked_openai):
         """Test test scenarios generation with AI success"""
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[
-            0
-        ].message.content = """
-        [
-            {
-                "title": "Search for existing product",
-                "description": "Search for a product that exists in catalog",
-                "steps": ["Navigate to search page", "Enter product name", "Click search"],
-                "expected_result": "Product found and displayed",
-                "priority": "high",
-                "tags": ["search", "positive"]
-            }
-        ]
-        """
-
-        with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test-key"}):
-            with patch("openai.OpenAI") as mock_openai:
-                mock_client = Mock()
-                mock_client.chat.completions.create.return_value = mock_response
-                mock_openai.return_value = mock_client
+        generator, mock_client = ai_with_mocked_openai
+        mock_client.chat.completions.create.return_value = _mock_completion(
+            SCENARIOS_JSON
+        )
 
-                generator = AIDataGenerator()
-                scenarios = generator.generate_test_scenarios("search")
+        scenarios = generator.generate_test_scenarios("search")
 
-                assert len(scenarios) == 1
-                assert scenarios[0]["title"] == "Search for existing product"
-                assert scenarios[0]["priority"] == "high"
+        assert len(scenarios) == 1
+        assert scenarios[0]["title"] == SCENARIOS[0]["title"]
+        assert scenarios[0]["priority"] == SCENARIOS[0]["priority"]
 
-    def test_different_user_types(self):
+    @pytest.mark.parametrize("user_type", ["customer", "admin", "vendor"])
+    def test_different_user_types(self, user_type):
         """Test generation of different user types"""
         generator = AIDataGenerator()
         generator.openai_client = None  # Force Faker fallback
 
-        user_types = ["customer", "admin", "vendor"]
-
-        for user_type in user_types:
-            user = generator.generate_user_profile(user_type)
-            assert "first_name" in user
-            assert "last_name" in user
-            assert "email" in user
+        user = generator.generate_user_profile(user_type)
+        assert "first_name" in user
+        assert "last_name" in user
+        assert "email" in user
 
-    def test_different_product_categories(self):
+    @pytest.mark.parametrize(
+        "category", ["electronics", "clothing", "books", "home", "sports"]
+    )
+    def test_different_product_categories(self, category):
         """Test generation of different product categories"""
         generator = AIDataGenerator()
         generator.openai_client = None  # Force Faker fallback
 
-        categories = ["electronics", "clothing", "books", "home", "sports"]
+        products = generator.generate_product_catalog(category, 2)
+        assert len(products) == 2
+        assert {product["category"] for product in products} == {category}
 
-        for category in categories:
-            products = generator.generate_product_catalog(category, 2)
-            assert len(products) == 2
+    def test_configurable_openai_settings(self, monkeypatch):
+        """Test that OpenAI settings are configurable"""
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test-key")
+        monkeypatch.setenv("OPENAI_MODEL", "gpt-4")
+        monkeypatch.setenv("OPENAI_MAX_TOKENS", "2000")
+        monkeypatch.setenv("OPENAI_TEMPERATURE", "0.5")
+
+        with patch("openai.OpenAI") as mock_openai:
+            mock_client = Mock()
+            mock_client.chat.completions.create.return_value = _mock_completion(
+                '{"first_name": "Test"}'
+            )
+            mock_openai.return_value = mock_client
+
+            # Mock the settings to return our test values
+            with patch("src.core.utils.ai_data_generator.settings") as mock_settings:
+                mock_settings.openai_model = "gpt-4"
+                mock_settings.openai_max_tokens = 2000
+                mock_settings.openai_temperature = 0.5
 
-            for product in products:
-                assert product["category"] == category
+                generator = AIDataGenerator()
 
-    def test_configurable_openai_settings(self):
-        """Test that OpenAI settings are configurable"""
-        with patch.dict(
-            os.environ,
-            {
-                "OPENAI_API_KEY": "sk-test-key",
-                "OPENAI_MODEL": "gpt-4",
-                "OPENAI_MAX_TOKENS": "2000",
-                "OPENAI_TEMPERATURE": "0.5",
-            },
-        ):
-            with patch("openai.OpenAI") as mock_openai:
-                mock_client = Mock()
-                mock_response = Mock()
-                mock_response.choices = [Mock()]
-                mock_response.choices[0].message.content = '{"first_name": "Test"}'
-                mock_client.chat.completions.create.return_value = mock_response
-                mock_openai.return_value = mock_client
-
-                # Mock the settings to return our test values
-                with patch(
-                    "src.core.utils.ai_data_generator.settings"
-                ) as mock_settings:
-                    mock_settings.openai_model = "gpt-4"
-                    mock_settings.openai_max_tokens = 2000
-                    mock_settings.openai_temperature = 0.5
-
-                    generator = AIDataGenerator()
-
-                    # Test that settings are used
-                    generator.generate_user_profile("customer")
-
-                    # Verify that the correct model and parameters were used
-                    mock_client.chat.completions.create.assert_called_once()
-                    call_args = mock_client.chat.completions.create.call_args
-
-                    assert call_args[1]["model"] == "gpt-4"
-                    assert call_args[1]["max_tokens"] == 2000
-                    assert call_args[1]["temperature"] == 0.5
+                # Test that settings are used
+                generator.generate_user_profile("customer")
+
+                # Verify that the correct model and parameters were used
+                mock_client.chat.completions.create.assert_called_once()
+                call_args = mock_client.chat.completions.create.call_args
+
+                assert call_args[1]["model"] == "gpt-4"
+                assert call_args[1]["max_tokens"] == 2000
+                assert call_args[1]["temperature"] == 0.5
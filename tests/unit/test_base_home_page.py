@@ -0,0 +1,49 @@
+"""
+Unit tests for BaseHomePage
+Tests reuse of an already loaded home page
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.ui.pages.automation_exercise_home_page import AutomationExerciseHomePage
+from src.ui.pages.home_page import HomePage
+from src.ui.pages.nopcommerce_home_page import NopCommerceHomePage
+
+HOME_URL = "https://automationexercise.com/"
+
+
+@pytest.mark.parametrize(
+    "current_url, should_open",
+    [
+        (HOME_URL, False),
+        (HOME_URL.rstrip("/"), False),
+        (HOME_URL + "products", True),
+        ("data:,", True),
+    ],
+)
+def test_ensure_home_page_opens_only_when_elsewhere(current_url, should_open):
+    """The home page is reloaded only when the browser has left it"""
+    page = AutomationExerciseHomePage(Mock(current_url=current_url))
+
+    with patch.object(page, "open_home_page") as open_home_page:
+        page.ensure_home_page()
+
+    assert open_home_page.called is should_open
+
+
+@pytest.mark.parametrize(
+    "page_class, home_url",
+    [(HomePage, HOME_URL), (NopCommerceHomePage, "https://demo.nopcommerce.com/")],
+)
+def test_ensure_home_page_uses_each_page_url(page_class, home_url):
+    """Every home page object checks the browser against its own URL"""
+    page = page_class(Mock(current_url=home_url))
+
+    with patch.object(page, "open_home_page") as open_home_page:
+        page.ensure_home_page()
+        page.driver.current_url = "data:,"
+        page.ensure_home_page()
+
+    open_home_page.assert_called_once()
@@ -0,0 +1,349 @@
+"""
+Unit tests for VisualTester
+Tests hashing, result caching and local comparison on synthetic images
+"""
+
+import os
+import time
+from unittest.mock import Mock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+from src.core.utils import visual_testing
+from src.core.utils.visual_testing import VisualTester
+
+# 80x90 image brightening by 25 every 10 columns, so each dHash cell is distinct
+GRADIENT = np.repeat(
+    np.repeat(np.arange(9, dtype=np.uint8) * 25, 10)[np.newaxis, :, np.newaxis],
+    80,
+    axis=0,
+).repeat(3, axis=2)
+
+
+def _with_patch(image: np.ndarray, top: int = 10, left: int = 10) -> np.ndarray:
+    """Copy of an image with a white 2x2 patch, too small to change its dHash"""
+    changed = image.copy()
+    changed[top : top + 2, left : left + 2] = 255
+    return changed
+
+
+@pytest.fixture
+def tester(tmp_path, monkeypatch):
+    """VisualTester under tmp_path whose Applitools check passes unless changed"""
+    monkeypatch.setattr(
+        visual_testing, "VISUAL_CACHE_PATH", str(tmp_path / "visual_cache.db")
+    )
+    monkeypatch.setattr(
+        visual_testing.settings, "screenshot_dir", str(tmp_path / "screenshots")
+    )
+    monkeypatch.setattr(visual_testing.settings, "applitools_api_key", None)
+    monkeypatch.setattr(visual_testing.settings, "persist_screenshots", False)
+    tester = VisualTester()
+    tester.eyes = Mock()
+    tester._check_with_applitools = Mock(return_value={"status": "passed"})
+    yield tester
+    tester.close()
+
+
+def _check(tester: VisualTester, image: np.ndarray, page_name: str = "page"):
+    """Run check_page_layout with the given image as the screenshot"""
+    with patch.object(tester, "_take_screenshot", return_value=image):
+        return tester.check_page_layout(page_name, Mock())
+
+
+class TestDHash:
+    """Tests for the perceptual hash"""
+
+    def test_flat_image_hashes_to_zero(self, tester):
+        assert tester._dhash(np.full((80, 90, 3), 128, np.uint8)) == 0
+
+    def test_rising_gradient_sets_every_bit(self, tester):
+        assert tester._dhash(GRADIENT) == 2**64 - 1
+
+    def test_small_change_keeps_hash(self, tester):
+        assert tester._dhash(_with_patch(GRADIENT)) == tester._dhash(GRADIENT)
+
+
+def _test_result(test_name: str, passed: bool = True) -> Mock:
+    """Runner result container of an Applitools test"""
+    container = Mock(exception=None, test_results=Mock(is_passed=passed))
+    container.test_results.name = test_name
+    return container
+
+
+class TestResultCache:
+    """Tests for the exact-screenshot and page-hash caches"""
+
+    def test_new_baseline_is_not_cached(self, tester):
+        first = _check(tester, GRADIENT)
+        second = _check(tester, GRADIENT)
+
+        assert first["status"] == "warning"
+        assert "cached" not in second
+        assert second["status"] == "passed"
+
+    def test_identical_screenshot_hits_cache(self, tester):
+        _check(tester, GRADIENT)
+        _check(tester, GRADIENT)
+
+        result = _check(tester, GRADIENT)
+
+        assert result["cached"] is True
+        assert result["status"] == "passed"
+
+    def test_cache_hit_returns_full_result(self, tester):
+        _check(tester, GRADIENT)
+        checked = _check(tester, GRADIENT)
+
+        result = _check(tester, GRADIENT)
+
+        assert result["custom"] == checked["custom"]
+        assert result["applitools"]["status"] == "passed"
+        assert result["recommendations"] == checked["recommendations"]
+
+    def test_replaced_baseline_invalidates_cache(self, tester):
+        _check(tester, GRADIENT)
+        _check(tester, GRADIENT)
+        baseline_path = os.path.join(tester.baseline_dir, "page.png")
+        cv2.imwrite(baseline_path, _with_patch(GRADIENT))
+        os.utime(baseline_path, (time.time() + 5, time.time() + 5))
+
+        result = _check(tester, GRADIENT)
+
+        assert "cached" not in result
+        assert result["status"] == "failed"
+
+    def test_hash_match_skips_only_applitools(self, tester):
+        _check(tester, GRADIENT)
+        tester._collect_applitools_results([_test_result("page")])
+
+        result = _check(tester, _with_patch(GRADIENT))
+
+        tester._check_with_applitools.assert_called_once()
+        assert "cached" not in result
+        assert result["applitools"]["cached"] is True
+        assert result["status"] == "failed"
+        assert result["custom"]["differences"]["changed_pixels"] > 0
+
+    def test_unconfirmed_pass_is_not_cached_by_hash(self, tester):
+        _check(tester, GRADIENT)
+        _check(tester, _with_patch(GRADIENT))
+
+        assert tester._check_with_applitools.call_count == 2
+
+    def test_unresolved_test_is_not_cached_by_hash(self, tester):
+        _check(tester, GRADIENT)
+
+        not_passed = tester._collect_applitools_results(
+            [_test_result("page", passed=False)]
+        )
+
+        assert not_passed == ["page"]
+        assert not tester._applitools_passed("page", tester._dhash(GRADIENT))
+
+    def test_batch_pass_is_cached_under_its_test_name(self, tester):
+        with tester.batch("journey", Mock()):
+            _check(tester, GRADIENT)
+        tester._collect_applitools_results([_test_result("journey")])
+
+        assert tester._applitools_passed("page", tester._dhash(GRADIENT))
+
+    def test_cached_pass_expires(self, tester):
+        dhash = tester._dhash(GRADIENT)
+        tester._cache_applitools_pass("page", dhash)
+        with tester.cache_db:
+            tester.cache_db.execute("UPDATE applitools_passes SET ts = 0")
+
+        assert not tester._applitools_passed("page", dhash)
+
+    @pytest.mark.parametrize("applitools_status", ["failed", "error"])
+    def test_applitools_failure_is_not_cached_by_hash(self, tester, applitools_status):
+        tester._check_with_applitools.return_value = {"status": applitools_status}
+
+        _check(tester, GRADIENT)
+        tester._collect_applitools_results([_test_result("page")])
+        _check(tester, _with_patch(GRADIENT))
+
+        assert tester._check_with_applitools.call_count == 2
+        assert not tester._applitools_passed("page", tester._dhash(GRADIENT))
+
+    def test_error_is_not_cached(self, tester):
+        tester._check_with_applitools.return_value = {"status": "error"}
+        _check(tester, GRADIENT)
+        changed = _with_patch(GRADIENT)
+
+        result = _check(tester, changed)
+
+        assert result["status"] == "failed"
+        assert (
+            tester._get_cached_result(tester._screenshot_key("page", changed)) is None
+        )
+
+
+class TestCompareImages:
+    """Tests for the local pixel comparison"""
+
+    def test_baseline_array_is_moved_into_place(self, tester):
+        baseline_path = os.path.join(tester.baseline_dir, "sidecar.png")
+
+        tester._create_baseline(GRADIENT, baseline_path)
+
+        assert sorted(os.listdir(tester.baseline_dir)) == [
+            "sidecar.npy",
+            "sidecar.png",
+        ]
+        assert np.array_equal(
+            np.load(tester._baseline_array_path(baseline_path)), GRADIENT
+        )
+
+    @pytest.mark.parametrize("row", [10, 11])
+    def test_one_pixel_line_is_detected(self, tester, row):
+        baseline_path = os.path.join(tester.baseline_dir, "line.png")
+        tester._create_baseline(GRADIENT, baseline_path)
+        changed = GRADIENT.copy()
+        changed[row] += 50
+
+        result = tester._compare_images(baseline_path, changed)
+
+        # Each changed pixel lands in its own cell of the half-size grid
+        assert result["changed_pixels"] == 45
+
+    def test_small_shift_is_ignored(self, tester):
+        baseline_path = os.path.join(tester.baseline_dir, "shift.png")
+        tester._create_baseline(GRADIENT, baseline_path)
+
+        result = tester._compare_images(baseline_path, GRADIENT + 10)
+
+        assert result["changed_pixels"] == 0
+        assert result["diff"] is None
+
+
+def _png(image: np.ndarray) -> bytes:
+    """Encode an image as PNG bytes"""
+    return cv2.imencode(".png", image)[1].tobytes()
+
+
+class TestFindChangedRegions:
+    """Tests for block-based change detection"""
+
+    # 100x130 image: 3x4 blocks of 40 pixels, the last row and column partial
+    BLANK = np.zeros((100, 130, 3), np.uint8)
+
+    def _changed(self, *pixels: tuple[int, int]) -> np.ndarray:
+        image = self.BLANK.copy()
+        for y, x in pixels:
+            image[y, x] = 255
+        return image
+
+    def test_identical_images_have_no_regions(self, tester):
+        png = _png(self.BLANK)
+
+        assert tester.find_changed_regions(png, png) == []
+
+    def test_touching_blocks_merge(self, tester):
+        after = self._changed((5, 5), (5, 45))
+
+        regions = tester.find_changed_regions(_png(self.BLANK), _png(after))
+
+        assert regions == [(0, 0, 80, 40)]
+
+    def test_separate_blocks_stay_apart(self, tester):
+        after = self._changed((5, 5), (5, 85))
+
+        regions = tester.find_changed_regions(_png(self.BLANK), _png(after))
+
+        assert sorted(regions) == [(0, 0, 40, 40), (80, 0, 40, 40)]
+
+    def test_edge_block_is_clipped_to_image(self, tester):
+        after = self._changed((95, 125))
+
+        regions = tester.find_changed_regions(_png(self.BLANK), _png(after))
+
+        assert regions == [(120, 80, 10, 20)]
+
+    def test_size_change_marks_whole_image(self, tester):
+        before = np.zeros((60, 130, 3), np.uint8)
+
+        regions = tester.find_changed_regions(_png(before), _png(self.BLANK))
+
+        assert regions == [(0, 0, 130, 100)]
+
+
+class TestCheckRegionsBatch:
+    """Tests for diffing same-sized regions as one stack"""
+
+    REGIONS = {"first": (0, 0, 90, 80), "second": (100, 0, 90, 80)}
+
+    def _check_regions(self, tester, *images, regions=REGIONS):
+        with patch.object(tester, "_take_screenshot", side_effect=images):
+            return tester.check_regions_batch("cards", Mock(), regions)
+
+    def test_first_run_creates_region_baselines(self, tester):
+        results = self._check_regions(tester, GRADIENT, GRADIENT)
+
+        assert {name: result["status"] for name, result in results.items()} == {
+            "first": "baseline_created",
+            "second": "baseline_created",
+        }
+        for name in self.REGIONS:
+            assert os.path.exists(
+                os.path.join(tester.baseline_dir, f"cards_{name}.png")
+            )
+
+    def test_moved_region_keeps_its_baseline(self, tester):
+        self._check_regions(tester, GRADIENT, GRADIENT)
+        moved = {name: (x, y + 1, w, h) for name, (x, y, w, h) in self.REGIONS.items()}
+
+        results = self._check_regions(tester, GRADIENT, GRADIENT, regions=moved)
+
+        assert [result["status"] for result in results.values()] == ["passed"] * 2
+
+    def test_stacked_regions_match_single_comparison(self, tester):
+        self._check_regions(tester, GRADIENT, GRADIENT)
+        changed = _with_patch(GRADIENT)
+
+        with patch.object(
+            tester,
+            "_check_with_custom_algorithm",
+            wraps=tester._check_with_custom_algorithm,
+        ) as single_check:
+            results = self._check_regions(tester, GRADIENT, changed)
+
+        single_check.assert_not_called()
+        assert results["first"]["status"] == "passed"
+        assert results["second"]["status"] == "failed"
+        single = tester._compare_images(
+            os.path.join(tester.baseline_dir, "cards_second.png"), changed
+        )
+        assert results["second"]["differences"] == {
+            "changed_pixels": single["changed_pixels"],
+            "difference_percentage": single["difference_percentage"],
+        }
+
+
+class TestApplitoolsResults:
+    """Tests for reading Applitools match and test results"""
+
+    @pytest.mark.parametrize(
+        "as_expected, status", [(True, "passed"), (False, "failed")]
+    )
+    def test_check_status_follows_as_expected(
+        self, tester, monkeypatch, as_expected, status
+    ):
+        monkeypatch.setattr(visual_testing, "Target", Mock(), raising=False)
+        tester.eyes.check.return_value = Mock(as_expected=as_expected)
+
+        result = VisualTester._check_with_applitools(tester, "page", Mock(), None)
+
+        assert result["status"] == status
+
+    def test_close_reports_tests_that_did_not_pass(self, tester):
+        tester.runner = Mock()
+        tester.runner.get_all_test_results.return_value = [
+            _test_result("about"),
+            _test_result("home", passed=False),
+        ]
+
+        assert tester.close() == ["home"]
@@ -3,24 +3,158 @@ Applitools Eyes integration test
 Demonstrates AI-powered visual testing
 """
 
-import time
+import hashlib
 
 import pytest
-from selenium.webdriver.common.by import By
+from loguru import logger
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
 
+from src.core.utils.constants import VALID_VISUAL_STATUSES, VISUAL_LOCATORS
 from src.core.utils.visual_testing import VisualTester
 from src.ui.pages.automation_exercise_home_page import AutomationExerciseHomePage
 
+# Viewports for the responsive check, as (width, height)
+VIEWPORTS = {"desktop": (1920, 1080), "tablet": (768, 1024), "mobile": (375, 667)}
+
+# True once the document, its web fonts and its images have finished loading
+PAGE_READY_SCRIPT = """
+return document.readyState === "complete"
+    && document.fonts.status === "loaded"
+    && Array.from(document.images).every(img => img.complete);
+"""
+
+# Page coordinates of the element matching arguments[0], as [x, y, width, height]
+ELEMENT_RECT_SCRIPT = """
+const rect = document.querySelector(arguments[0]).getBoundingClientRect();
+return [
+    Math.round(rect.x + window.scrollX),
+    Math.round(rect.y + window.scrollY),
+    Math.round(rect.width),
+    Math.round(rect.height),
+];
+"""
+
+# Product id and page coordinates of the first arguments[1] cards matching
+# arguments[0], as [id, [x, y, width, height]]
+PRODUCT_CARD_RECTS_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0]))
+    .slice(0, arguments[1])
+    .map(el => {
+        const rect = el.getBoundingClientRect();
+        return [
+            el.querySelector("[data-product-id]").dataset.productId,
+            [
+                Math.round(rect.x + window.scrollX),
+                Math.round(rect.y + window.scrollY),
+                Math.round(rect.width),
+                Math.round(rect.height),
+            ],
+        ];
+    });
+"""
+
+# For each viewport region in arguments[0], the DOM path and page coordinates of
+# the element at its centre, as [path, [x, y, width, height]], or null
+ELEMENTS_AT_SCRIPT = """
+const pathOf = el => {
+    const parts = [];
+    for (; el && el !== document.documentElement; el = el.parentElement) {
+        const index = Array.from(el.parentElement.children).indexOf(el) + 1;
+        parts.unshift(`${el.tagName.toLowerCase()}:nth-child(${index})`);
+    }
+    return parts.join(">");
+};
+return arguments[0].map(([x, y, width, height]) => {
+    const el = document.elementFromPoint(x + width / 2, y + height / 2);
+    if (!el) return null;
+    const rect = el.getBoundingClientRect();
+    return [
+        pathOf(el),
+        [
+            Math.round(rect.x + window.scrollX),
+            Math.round(rect.y + window.scrollY),
+            Math.round(rect.width),
+            Math.round(rect.height),
+        ],
+    ];
+});
+"""
+
+# Product cards compared together by the batch region check
+PRODUCT_CARD_COUNT = 6
+
+# Calls back after two animation frames, once pending style changes are painted
+PAINT_FLUSH_SCRIPT = """
+const done = arguments[arguments.length - 1];
+requestAnimationFrame(() => requestAnimationFrame(done));
+"""
+
 
 class TestApplitoolsIntegration:
     """Applitools Eyes integration tests"""
 
+    @pytest.fixture(scope="class")
+    def home_page(self, driver):
+        """Home page object, loaded once for the class"""
+        home_page = AutomationExerciseHomePage(driver)
+        home_page.open_home_page()
+        return home_page
+
+    @pytest.fixture(scope="class")
+    def class_visual_tester(self):
+        """Visual tester shared by the class"""
+        visual_tester = VisualTester()
+        yield visual_tester
+        not_passed = visual_tester.close()
+        assert not not_passed, f"Applitools tests did not pass: {not_passed}"
+
     @pytest.fixture(autouse=True)
-    def setup(self, driver):
+    def setup(self, driver, home_page, class_visual_tester):
         """Test setup"""
         self.driver = driver
-        self.visual_tester = VisualTester()
-        self.home_page = AutomationExerciseHomePage(driver)
+        self.visual_tester = class_visual_tester
+        self.home_page = home_page
+
+    def _el(self, name):
+        """Find an element by its name in VISUAL_LOCATORS"""
+        return self.driver.find_element(*VISUAL_LOCATORS[name])
+
+    def _wait_ready(self, driver, timeout=5):
+        """Wait until the page has settled enough to be captured"""
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda d: d.execute_script(PAGE_READY_SCRIPT)
+            )
+        except TimeoutException:
+            logger.warning("Page still loading resources, capturing anyway")
+
+    def _wait_painted(self, driver):
+        """Wait for style changes made through JavaScript to be painted"""
+        driver.execute_async_script(PAINT_FLUSH_SCRIPT)
+
+    def _check_changed_regions(self, page_name, before_png):
+        """Check only the elements that changed since the given screenshot"""
+        after_png = self.driver.get_screenshot_as_png()
+        regions = self.visual_tester.find_changed_regions(before_png, after_png)
+        assert regions, f"No change found on the page for {page_name}"
+
+        # Baselines are keyed by element, so a shifted layout diffs against them
+        elements = dict(
+            hit
+            for hit in self.driver.execute_script(ELEMENTS_AT_SCRIPT, regions)
+            if hit
+        )
+        assert elements, f"No changed element found for {page_name}"
+        results = []
+        for path, rect in elements.items():
+            element_id = hashlib.blake2b(path.encode(), digest_size=6).hexdigest()
+            results.append(
+                self.visual_tester.check_page_layout(
+                    f"{page_name}_{element_id}", self.driver, region=tuple(rect)
+                )
+            )
+        return results
 
     def test_home_page_visual_baseline(self):
         """
@@ -32,21 +166,19 @@ class TestApplitoolsIntegration:
         3. On subsequent runs compares with baseline
         4. Uses AI to analyze differences
         """
-        # Open home page
-        self.home_page.open_home_page()
-        time.sleep(3)  # Wait for full loading
+        # Home page is loaded once for the class
+        self.home_page.ensure_home_page()
+        self._wait_ready(self.driver)
 
         # Create baseline (first run)
         result = self.visual_tester.check_page_layout("home_page_baseline", self.driver)
 
         # Check that baseline was created
-        assert result["status"] in [
-            "passed",
-            "warning",
-            "failed",
-        ], f"Baseline not created: {result['status']}"
+        assert (
+            result["status"] in VALID_VISUAL_STATUSES
+        ), f"Baseline not created: {result['status']}"
 
-        print(f"✅ Baseline created: {result['status']}")
+        logger.info("✅ Baseline created: {}", result["status"])
 
     def test_home_page_visual_comparison(self):
         """
@@ -57,9 +189,9 @@ class TestApplitoolsIntegration:
         - Focuses on critical UI changes
         - Provides detailed reporting
         """
-        # Open home page
-        self.home_page.open_home_page()
-        time.sleep(3)
+        # Home page is loaded once for the class
+        self.home_page.ensure_home_page()
+        self._wait_ready(self.driver)
 
         # Compare with baseline
         result = self.visual_tester.check_page_layout(
@@ -67,18 +199,16 @@ class TestApplitoolsIntegration:
         )
 
         # Check result
-        assert result["status"] in [
-            "passed",
-            "failed",
-            "warning",
-        ], f"Unexpected status: {result['status']}"
+        assert (
+            result["status"] in VALID_VISUAL_STATUSES
+        ), f"Unexpected status: {result['status']}"
 
         if result["status"] == "failed":
-            print("❌ Visual differences detected!")
+            logger.info("❌ Visual differences detected!")
             if "diff_image" in result:
-                print(f"📷 Diff image: {result['diff_image']}")
+                logger.info("📷 Diff image: {}", result["diff_image"])
         else:
-            print("✅ No visual differences detected")
+            logger.info("✅ No visual differences detected")
 
     def test_header_region_visual_check(self):
         """
@@ -89,34 +219,57 @@ class TestApplitoolsIntegration:
         - Ignore dynamic content
         - More precise testing
         """
-        self.home_page.open_home_page()
-        time.sleep(3)
-
-        # Find header element
-        header = self.driver.find_element(By.CSS_SELECTOR, ".header-middle")
-        header_location = header.location
-        header_size = header.size
-
-        # Define region for checking
-        region = (
-            header_location["x"],
-            header_location["y"],
-            header_size["width"],
-            header_size["height"],
-        )
+        self.home_page.ensure_home_page()
+        self._wait_ready(self.driver)
+
+        # Read the header region in one round-trip
+        _, header_selector = VISUAL_LOCATORS["header_middle"]
+        region = tuple(self.driver.execute_script(ELEMENT_RECT_SCRIPT, header_selector))
 
         # Check only header region
         result = self.visual_tester.check_page_layout(
             "header_region", self.driver, region=region
         )
 
-        assert result["status"] in [
-            "passed",
-            "failed",
-            "warning",
-        ], f"Unexpected status for header: {result['status']}"
+        assert (
+            result["status"] in VALID_VISUAL_STATUSES
+        ), f"Unexpected status for header: {result['status']}"
+
+        logger.info("📊 Header check: {}", result["status"])
 
-        print(f"📊 Header check: {result['status']}")
+    def test_product_cards_visual_check(self):
+        """
+        Test visual check of product cards as one batch
+
+        Cards of equal size are compared with their baselines in a single
+        pass, each against the baseline of its own product.
+        """
+        self.home_page.ensure_home_page()
+        self._wait_ready(self.driver)
+
+        _, card_selector = VISUAL_LOCATORS["product_card"]
+        regions = {
+            product_id: tuple(rect)
+            for product_id, rect in self.driver.execute_script(
+                PRODUCT_CARD_RECTS_SCRIPT, card_selector, PRODUCT_CARD_COUNT
+            )
+        }
+        assert regions, "No product cards found"
+
+        results = self.visual_tester.check_regions_batch(
+            "product_card", self.driver, regions
+        )
+
+        assert results.keys() == regions.keys()
+        for product_id, result in results.items():
+            assert (
+                result["status"] != "error"
+            ), f"Product card {product_id} check failed: {result.get('error')}"
+
+        logger.info(
+            "📊 Product cards: {}",
+            {product_id: result["status"] for product_id, result in results.items()},
+        )
 
     def test_visual_check_after_interaction(self):
         """
@@ -128,33 +281,43 @@ class TestApplitoolsIntegration:
         - After navigation
         """
         self.home_page.open_home_page()
-        time.sleep(3)
-
-        # Baseline check
-        baseline_result = self.visual_tester.check_page_layout(
-            "before_interaction", self.driver
-        )
-
-        # Simulate interaction (e.g., hover over element)
-        products_link = self.driver.find_element(By.CSS_SELECTOR, "a[href='/products']")
-        self.driver.execute_script(
-            "arguments[0].style.backgroundColor = 'yellow';", products_link
-        )
-        time.sleep(2)
-
-        # Check after interaction
-        after_result = self.visual_tester.check_page_layout(
-            "after_interaction", self.driver
-        )
-
-        # Both results should be valid
-        assert baseline_result["status"] in ["passed", "failed", "warning"]
-        assert after_result["status"] in ["passed", "failed", "warning"]
+        self._wait_ready(self.driver)
 
-        print(f"📊 Before interaction: {baseline_result['status']}")
-        print(f"📊 After interaction: {after_result['status']}")
+        with self.visual_tester.batch("interaction", self.driver):
+            # Baseline check
+            baseline_result = self.visual_tester.check_page_layout(
+                "before_interaction", self.driver
+            )
+            before_png = self.driver.get_screenshot_as_png()
 
-    def test_responsive_visual_check(self):
+            # Simulate interaction (e.g., hover over element)
+            products_link = self._el("products_link")
+            self.driver.execute_script(
+                "arguments[0].style.backgroundColor = 'yellow';", products_link
+            )
+            self._wait_painted(self.driver)
+
+            # Check only what changed after interaction
+            after_results = self._check_changed_regions("after_interaction", before_png)
+
+        # All results should be valid
+        assert baseline_result["status"] in VALID_VISUAL_STATUSES
+        for result in after_results:
+            assert result["status"] in VALID_VISUAL_STATUSES
+
+        logger.info("📊 Before interaction: {}", baseline_result["status"])
+        logger.info("📊 After interaction: {}", [r["status"] for r in after_results])
+
+    # Each viewport is its own test item, so one failure does not hide the
+    # others. They still run one after another: --dist=loadscope sends the
+    # whole class to one worker, which shares a single browser.
+    @pytest.mark.parametrize(
+        "window_size, viewport",
+        [(size, name) for name, size in VIEWPORTS.items()],
+        indirect=["window_size"],
+        ids=list(VIEWPORTS),
+    )
+    def test_responsive_visual_check(self, window_size, viewport):
         """
         Test visual check on different screen sizes
 
@@ -163,42 +326,17 @@ class TestApplitoolsIntegration:
         - Considers responsive design
         - Compares elements in context of their size
         """
-        # Test on desktop
-        self.driver.set_window_size(1920, 1080)
         self.home_page.open_home_page()
-        time.sleep(3)
-
-        desktop_result = self.visual_tester.check_page_layout(
-            "home_page_desktop", self.driver
-        )
-
-        # Test on tablet
-        self.driver.set_window_size(768, 1024)
-        self.driver.refresh()
-        time.sleep(3)
-
-        tablet_result = self.visual_tester.check_page_layout(
-            "home_page_tablet", self.driver
-        )
-
-        # Test on mobile
-        self.driver.set_window_size(375, 667)
-        self.driver.refresh()
-        time.sleep(3)
+        self._wait_ready(self.driver)
 
-        mobile_result = self.visual_tester.check_page_layout(
-            "home_page_mobile", self.driver
+        result = self.visual_tester.check_page_layout(
+            f"home_page_{viewport}", self.driver
         )
 
-        # Check all results
-        results = [desktop_result, tablet_result, mobile_result]
-        for i, result in enumerate(["desktop", "tablet", "mobile"]):
-            assert results[i]["status"] in [
-                "passed",
-                "failed",
-                "warning",
-            ], f"Unexpected status for {result}: {results[i]['status']}"
-            print(f"📱 {result.capitalize()}: {results[i]['status']}")
+        assert (
+            result["status"] in VALID_VISUAL_STATUSES
+        ), f"Unexpected status for {viewport}: {result['status']}"
+        logger.info("📱 {}: {}", viewport.capitalize(), result["status"])
 
     def test_visual_check_with_ai_analysis(self):
         """
@@ -211,46 +349,55 @@ class TestApplitoolsIntegration:
         - Suggest fixes
         """
         self.home_page.open_home_page()
-        time.sleep(3)
+        self._wait_ready(self.driver)
 
-        # Create baseline
-        baseline_result = self.visual_tester.check_page_layout(
-            "ai_baseline", self.driver
-        )
+        with self.visual_tester.batch("ai_analysis", self.driver):
+            # Create baseline
+            baseline_result = self.visual_tester.check_page_layout(
+                "ai_baseline", self.driver
+            )
+            baseline_png = self.driver.get_screenshot_as_png()
 
-        # Simulate minor change (AI should ignore)
-        self.driver.execute_script(
+            # Simulate minor change (AI should ignore)
+            self.driver.execute_script(
+                """
+                document.body.style.color = '#666666';
             """
-            document.body.style.color = '#666666';
-        """
-        )
-        time.sleep(2)
+            )
+            self._wait_painted(self.driver)
 
-        minor_change_result = self.visual_tester.check_page_layout(
-            "ai_minor_change", self.driver
-        )
+            minor_change_results = self._check_changed_regions(
+                "ai_minor_change", baseline_png
+            )
 
-        # Simulate critical change (AI should detect)
-        self.driver.execute_script(
+            # The header's own rect is where the critical change shows up
+            _, header_selector = VISUAL_LOCATORS["header_middle"]
+            header_region = tuple(
+                self.driver.execute_script(ELEMENT_RECT_SCRIPT, header_selector)
+            )
+
+            # Simulate critical change (AI should detect)
+            self.driver.execute_script(
+                """
+                document.querySelector('.header-middle').style.display = 'none';
             """
-            document.querySelector('.header-middle').style.display = 'none';
-        """
-        )
-        time.sleep(2)
+            )
+            self._wait_painted(self.driver)
 
-        critical_change_result = self.visual_tester.check_page_layout(
-            "ai_critical_change", self.driver
-        )
+            critical_change_result = self.visual_tester.check_page_layout(
+                "ai_critical_change", self.driver, region=header_region
+            )
 
         # Check results
-        assert baseline_result["status"] in ["passed", "failed", "warning"]
-        assert minor_change_result["status"] in ["passed", "failed", "warning"]
-        assert critical_change_result["status"] in ["passed", "failed", "warning"]
+        assert baseline_result["status"] in VALID_VISUAL_STATUSES
+        for result in minor_change_results:
+            assert result["status"] in VALID_VISUAL_STATUSES
+        assert critical_change_result["status"] in VALID_VISUAL_STATUSES
 
-        print("🤖 AI analysis results:")
-        print(f"   Baseline: {baseline_result['status']}")
-        print(f"   Minor change: {minor_change_result['status']}")
-        print(f"   Critical change: {critical_change_result['status']}")
+        logger.info("🤖 AI analysis results:")
+        logger.info("   Baseline: {}", baseline_result["status"])
+        logger.info("   Minor change: {}", [r["status"] for r in minor_change_results])
+        logger.info("   Critical change: {}", critical_change_result["status"])
 
     def test_visual_check_error_handling(self):
         """
@@ -266,13 +413,13 @@ class TestApplitoolsIntegration:
             result = self.visual_tester.check_page_layout(
                 "error_test", None  # Pass None instead of driver
             )
-            print(f"📊 Result with error: {result['status']}")
+            logger.info("📊 Result with error: {}", result["status"])
         except Exception as e:
-            print(f"✅ Error handled correctly: {type(e).__name__}")
+            logger.info("✅ Error handled correctly: {}", type(e).__name__)
 
         # Test with incorrect region
-        self.home_page.open_home_page()
-        time.sleep(3)
+        self.home_page.ensure_home_page()
+        self._wait_ready(self.driver)
 
         try:
             result = self.visual_tester.check_page_layout(
@@ -280,9 +427,9 @@ class TestApplitoolsIntegration:
                 self.driver,
                 region=(9999, 9999, 100, 100),  # Invalid coordinates
             )
-            print(f"📊 Result with invalid region: {result['status']}")
+            logger.info("📊 Result with invalid region: {}", result["status"])
         except Exception as e:
-            print(f"✅ Invalid region handled: {type(e).__name__}")
+            logger.info("✅ Invalid region handled: {}", type(e).__name__)
 
 
 # Markers for test grouping